@@ -8,7 +8,9 @@ from .spectral_core import (
     modular_spectrum,
     digital_spectrum,
     harmonic_spectrum,
-    spectral_vector
+    spectral_vector,
+    spectral_distance,
+    spectral_self_distance
 )
 
 from .coherence import (
@@ -18,6 +20,7 @@ from .coherence import (
 
 from .fold_topology import (
     fold_energy,
+    fold_energy_batch,
     sharp_fold_candidates,
     FoldTopology
 )
@@ -25,10 +28,11 @@ from .fold_topology import (
 from .interference import (
     prime_fib_interference,
     interference_extrema,
+    interference_extrema_from,
     identify_resonance_source
 )
 
-from .spectral_signature_cache import SpectralSignatureCache
+from .spectral_signature_cache import SpectralSignatureCache, SegmentedLRU
 
 from .accelerated_analysis import (
     accelerated_spectral_vector,
@@ -48,6 +52,8 @@ __all__ = [
     'digital_spectrum',
     'harmonic_spectrum',
     'spectral_vector',
+    'spectral_distance',
+    'spectral_self_distance',
     
     # Coherence
     'coherence',
@@ -55,16 +61,19 @@ __all__ = [
     
     # Fold Topology
     'fold_energy',
+    'fold_energy_batch',
     'sharp_fold_candidates',
     'FoldTopology',
     
     # Interference
     'prime_fib_interference',
     'interference_extrema',
+    'interference_extrema_from',
     'identify_resonance_source',
     
     # Acceleration
     'SpectralSignatureCache',
+    'SegmentedLRU',
     
     # Accelerated Analysis
     'accelerated_spectral_vector',
@@ -104,14 +104,10 @@ def accelerated_coherence_field(n: int, candidates: List[int], cache: Optional[S
     if cache is None:
         cache = get_global_cache()
         
-    field = {}
-    for x in candidates:
-        if n % x == 0:
-            complement = n // x
-            field[x] = cache.get_coherence(x, complement, n)
-        else:
-            # For non-factors, use a heuristic coherence
-            field[x] = 0.0
+    # Non-factors default to zero coherence; only factors need evaluating
+    field = dict.fromkeys(candidates, 0.0)
+    factors = [x for x in candidates if n % x == 0]
+    field.update(zip(factors, cache.get_coherence_batch(factors, n)))
             
     return field
 
@@ -132,7 +128,7 @@ def accelerated_fold_topology(n: int, cache: Optional[SpectralSignatureCache] =
         cache = get_global_cache()
         
     # Pre-compute some fold energies to warm up cache
-    root = int(math.isqrt(n))
+    root = math.isqrt(n)
     for x in range(2, min(root + 1, 100)):
         cache.get_fold_energy(n, x)
         
@@ -192,13 +188,9 @@ def accelerated_spectral_analysis(n: int, full_analysis: bool = True) -> Dict[st
     
     if full_analysis:
         # Sample coherence for some candidates
-        coherence_samples = {}
         candidates = list(set(sharp_folds[:5] + extrema[:5]))
-        
-        for x in candidates:
-            if n % x == 0:
-                complement = n // x
-                coherence_samples[x] = cache.get_coherence(x, complement, n)
+        factors = [x for x in candidates if n % x == 0]
+        coherence_samples = dict(zip(factors, cache.get_coherence_batch(factors, n)))
                 
         result['coherence_samples'] = coherence_samples
         
@@ -4,8 +4,12 @@ Implements coherence calculation with caching for efficiency
 """
 
 import math
+from collections import OrderedDict
 from typing import Dict, Tuple, Optional, List
-from .spectral_core import spectral_vector
+from .spectral_core import spectral_vector, spectral_distance
+
+# Beyond this squared distance exp(-d) < 1e-13: coherence saturates to zero
+SATURATION_DISTANCE = 30.0
 
 def coherence(a: int, b: int, n: int) -> float:
     """
@@ -25,18 +29,19 @@ def coherence(a: int, b: int, n: int) -> float:
     Returns:
         Coherence value in range [0, 1]
     """
-    # Get spectral vectors
+    # Get spectral vectors; a square n = a×a needs S(a) only once
     sa = spectral_vector(a)
-    sb = spectral_vector(b)
+    sb = sa if b == a else spectral_vector(b)
     sn = spectral_vector(n)
     
     # Calculate squared distance
     # For perfect factorization, we expect S(a) + S(b) ≈ 2*S(n)
     # So we measure ||S(a) + S(b) - 2*S(n)||²
-    squared_distance = 0.0
-    for i in range(len(sa)):
-        diff = sa[i] + sb[i] - 2 * sn[i]
-        squared_distance += diff * diff
+    squared_distance = spectral_distance(sa, sb, sn)
+    
+    # Saturated: skip the exponential entirely
+    if squared_distance > SATURATION_DISTANCE:
+        return 0.0
     
     # Convert to coherence using exponential decay
     return math.exp(-squared_distance)
@@ -49,16 +54,20 @@ class CoherenceCache:
     this cache stores computed values to avoid redundant calculations.
     """
     
+    __slots__ = ('max_size', 'spectral_cache', 'coherence_cache')
+    
     def __init__(self, max_size: int = 10000):
         """
         Initialize coherence cache
         
         Args:
-            max_size: Maximum number of entries to cache
+            max_size: Maximum number of entries to cache (at least the
+                most recent entry is always kept)
         """
         self.max_size = max_size
-        self.spectral_cache: Dict[int, List[float]] = {}
-        self.coherence_cache: Dict[Tuple[int, int, int], float] = {}
+        # LRU order: least recently used first
+        self.spectral_cache: Dict[int, List[float]] = OrderedDict()
+        self.coherence_cache: Dict[Tuple[int, int, int], float] = OrderedDict()
     
     def get_spectral(self, n: int) -> List[float]:
         """
@@ -70,16 +79,18 @@ class CoherenceCache:
         Returns:
             Spectral vector
         """
-        if n not in self.spectral_cache:
-            # Check cache size
-            if len(self.spectral_cache) >= self.max_size:
-                # Simple eviction: remove first entry
-                first_key = next(iter(self.spectral_cache))
-                del self.spectral_cache[first_key]
-            
-            self.spectral_cache[n] = spectral_vector(n)
+        spectrum = self.spectral_cache.get(n)
+        if spectrum is not None:
+            self.spectral_cache.move_to_end(n)
+            return spectrum
         
-        return self.spectral_cache[n]
+        # Check cache size (an empty store has nothing to evict)
+        if self.spectral_cache and len(self.spectral_cache) >= self.max_size:
+            # Evict least recently used entry
+            self.spectral_cache.popitem(last=False)
+        
+        spectrum = self.spectral_cache[n] = spectral_vector(n)
+        return spectrum
     
     def get_coherence(self, a: int, b: int, n: int) -> float:
         """
@@ -93,30 +104,37 @@ class CoherenceCache:
         Returns:
             Coherence value
         """
-        # Create canonical key (order doesn't matter for a, b)
-        key = (min(a, b), max(a, b), n)
-        
-        if key not in self.coherence_cache:
-            # Check cache size
-            if len(self.coherence_cache) >= self.max_size:
-                # Simple eviction: remove first entry
-                first_key = next(iter(self.coherence_cache))
-                del self.coherence_cache[first_key]
-            
-            # Get spectral vectors (with caching)
-            sa = self.get_spectral(a)
-            sb = self.get_spectral(b)
-            sn = self.get_spectral(n)
-            
-            # Calculate coherence
-            squared_distance = 0.0
-            for i in range(len(sa)):
-                diff = sa[i] + sb[i] - 2 * sn[i]
-                squared_distance += diff * diff
-            
-            self.coherence_cache[key] = math.exp(-squared_distance)
+        # Create canonical key (order doesn't matter for a, b). A plain
+        # tuple is exact for arbitrarily large n and hashes faster than
+        # mixing the operands into a single big-int key.
+        key = (a, b, n) if a <= b else (b, a, n)
+        
+        # Hits cost a single dict probe
+        value = self.coherence_cache.get(key)
+        if value is not None:
+            self.coherence_cache.move_to_end(key)
+            return value
+        
+        # Check cache size (an empty store has nothing to evict)
+        if self.coherence_cache and len(self.coherence_cache) >= self.max_size:
+            # Evict least recently used entry
+            self.coherence_cache.popitem(last=False)
         
-        return self.coherence_cache[key]
+        # Get spectral vectors (with caching)
+        sa = self.get_spectral(a)
+        sb = self.get_spectral(b)
+        sn = self.get_spectral(n)
+        
+        # Calculate coherence
+        squared_distance = spectral_distance(sa, sb, sn)
+        
+        if squared_distance > SATURATION_DISTANCE:
+            value = 0.0
+        else:
+            value = math.exp(-squared_distance)
+        
+        self.coherence_cache[key] = value
+        return value
     
     def clear(self):
         """Clear all cached values"""
@@ -139,11 +157,10 @@ def triple_coherence(p: int, q: int, r: int, n: int) -> float:
     Returns:
         Triple coherence value
     """
-    # Get spectral vectors
-    sp = spectral_vector(p)
-    sq = spectral_vector(q)
-    sr = spectral_vector(r)
-    sn = spectral_vector(n)
+    # Get spectral vectors, once per distinct value: repeated factors
+    # (p = q for n = p²r, or p = q = r for cubes) share a vector
+    spectra = {x: spectral_vector(x) for x in {p, q, r, n}}
+    sp, sq, sr, sn = spectra[p], spectra[q], spectra[r], spectra[n]
     
     # For triple product, we expect S(p) + S(q) + S(r) ≈ 3×S(n)
     squared_distance = 0.0
@@ -151,4 +168,48 @@ def triple_coherence(p: int, q: int, r: int, n: int) -> float:
         diff = sp[i] + sq[i] + sr[i] - 3 * sn[i]
         squared_distance += diff * diff
     
+    if squared_distance > SATURATION_DISTANCE:
+        return 0.0
+    
     return math.exp(-squared_distance)
+
+def triple_coherence_batch(ps: List[int], qs: List[int], rs: List[int],
+                           n: int) -> List[float]:
+    """
+    Calculate triple coherence for many (p, q, r) candidates at once
+    
+    Equivalent to [triple_coherence(p, q, r, n) for p, q, r in ...], but
+    S(n) is computed once and each distinct factor's spectral vector is
+    computed only once across the whole batch.
+    
+    Args:
+        ps: First factors
+        qs: Second factors
+        rs: Third factors
+        n: Target number
+        
+    Returns:
+        Triple coherence value for each candidate triple
+    """
+    sn = spectral_vector(n)
+    spectra: Dict[int, List[float]] = {}
+    results = []
+    
+    for p, q, r in zip(ps, qs, rs):
+        for x in (p, q, r):
+            if x not in spectra:
+                spectra[x] = spectral_vector(x)
+        
+        sp, sq, sr = spectra[p], spectra[q], spectra[r]
+        
+        squared_distance = 0.0
+        for i in range(len(sp)):
+            diff = sp[i] + sq[i] + sr[i] - 3 * sn[i]
+            squared_distance += diff * diff
+        
+        if squared_distance > SATURATION_DISTANCE:
+            results.append(0.0)
+        else:
+            results.append(math.exp(-squared_distance))
+    
+    return results
@@ -3,9 +3,15 @@ Fold Topology - Energy landscape and topological navigation
 Analyzes fold patterns in spectral space
 """
 
+import heapq
 import math
-from typing import List, Dict, Tuple, Set
-from .spectral_core import spectral_vector
+from itertools import repeat
+from typing import Iterable, List, Dict, Tuple, Set
+from .spectral_core import spectral_vector, spectral_distance
+
+# Minimum positions per worker when a sweep is split across processes;
+# shorter spans cost more in process start-up than they save
+_PARALLEL_MIN_SPAN = 20_000
 
 def fold_energy(n: int, x: int) -> float:
     """
@@ -28,25 +34,74 @@ def fold_energy(n: int, x: int) -> float:
     if x <= 0 or x > n:
         return float('inf')
     
-    if n % x != 0:
-        # For non-factors, use approximate complementary value
-        y = n / x
-    else:
-        y = n // x
+    # Complementary value: exact for factors, rounded down otherwise.
+    # Integer division stays exact for n beyond float precision.
+    y = n // x
     
     # Get spectral vectors
     sx = spectral_vector(x)
-    sy = spectral_vector(int(y))
+    sy = spectral_vector(y)
     sn = spectral_vector(n)
     
     # Calculate energy as squared distance
-    energy = 0.0
-    for i in range(len(sx)):
-        # Expected: sx + sy ≈ 2×sn for factors
-        diff = sx[i] + sy[i] - 2 * sn[i]
-        energy += diff * diff
+    # Expected: sx + sy ≈ 2×sn for factors
+    return spectral_distance(sx, sy, sn)
+
+def fold_energy_batch(n: int, positions: Iterable[int]) -> List[float]:
+    """
+    Calculate fold energies at many positions for the same n
+    
+    Equivalent to [fold_energy(n, x) for x in positions], but S(n) is
+    computed once and shared by every position.
+    
+    Args:
+        n: Number being factored
+        positions: Positions to evaluate
+        
+    Returns:
+        Fold energies in the order of positions
+    """
+    sn = spectral_vector(n)
+    energies = []
+    
+    for x in positions:
+        if x <= 0 or x > n:
+            energies.append(float('inf'))
+        else:
+            energies.append(spectral_distance(spectral_vector(x), spectral_vector(n // x), sn))
+    
+    return energies
+
+def _fold_energy_span(n: int, start: int, stop: int) -> List[float]:
+    """Fold energies of n for positions x in [start, stop)"""
+    return fold_energy_batch(n, range(start, stop))
+
+def _fold_energies(n: int, start: int, stop: int, workers: int = 1) -> List[float]:
+    """
+    Fold energies of n for positions x in [start, stop)
+    
+    Each position is independent, so with workers > 1 long sweeps are
+    evaluated as contiguous spans in separate processes and concatenated
+    in order. The pool is opt-in: callers using the spawn or forkserver
+    start methods must guard their entry point with __main__.
+    """
+    # At least _PARALLEL_MIN_SPAN positions per worker
+    workers = min(workers, (stop - start) // _PARALLEL_MIN_SPAN)
+    
+    if workers < 2:
+        return _fold_energy_span(n, start, stop)
     
-    return energy
+    chunk = -(-(stop - start) // workers)
+    starts = range(start, stop, chunk)
+    stops = [min(s + chunk, stop) for s in starts]
+    
+    # Imported on first use: the process machinery adds ~13ms to import
+    # time and serial sweeps never need it
+    from concurrent.futures import ProcessPoolExecutor
+    
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        spans = pool.map(_fold_energy_span, repeat(n), starts, stops)
+        return [energy for span in spans for energy in span]
 
 def sharp_fold_candidates(n: int, span: int = 25) -> List[int]:
     """
@@ -62,7 +117,7 @@ def sharp_fold_candidates(n: int, span: int = 25) -> List[int]:
     Returns:
         List of candidate positions sorted by curvature
     """
-    root = int(math.isqrt(n))
+    root = math.isqrt(n)
     
     # Define search window
     start = max(2, root - span)
@@ -70,7 +125,7 @@ def sharp_fold_candidates(n: int, span: int = 25) -> List[int]:
     window = list(range(start, end))
     
     # Calculate energies
-    energies = [fold_energy(n, x) for x in window]
+    energies = _fold_energies(n, start, end)
     
     # Calculate curvatures (second derivative)
     curvatures = []
@@ -79,11 +134,8 @@ def sharp_fold_candidates(n: int, span: int = 25) -> List[int]:
         curvature = energies[i - 1] - 2 * energies[i] + energies[i + 1]
         curvatures.append((curvature, window[i]))
     
-    # Sort by curvature (most negative first)
-    curvatures.sort()
-    
-    # Return top candidates
-    return [x for _, x in curvatures[:10]]
+    # Top candidates by curvature (most negative first)
+    return [x for _, x in heapq.nsmallest(10, curvatures)]
 
 class FoldTopology:
     """
@@ -93,25 +145,27 @@ class FoldTopology:
     connected components and paths between low-energy regions.
     """
     
-    def __init__(self, n: int):
+    __slots__ = ('n', 'root', 'points', 'connections')
+    
+    def __init__(self, n: int, workers: int = 1):
         """
         Initialize fold topology for number n
         
         Args:
             n: Number to analyze
+            workers: Processes for the energy sweep (1 keeps it serial)
         """
         self.n = n
-        self.root = int(math.isqrt(n))
+        self.root = math.isqrt(n)
         self.points: List[int] = []
         self.connections: Dict[int, List[Tuple[int, float]]] = {}
-        self._build_topology()
+        self._build_topology(workers)
     
-    def _build_topology(self):
+    def _build_topology(self, workers: int = 1):
         """Build the topological structure"""
-        # Find all local minima
-        energies = {}
-        for x in range(2, self.root + 1):
-            energies[x] = fold_energy(self.n, x)
+        # Dense energy table indexed by position; 0 and 1 are never sampled
+        energies = [math.inf, math.inf]
+        energies.extend(_fold_energies(self.n, 2, self.root + 1, workers))
         
         # Identify local minima
         for x in range(3, self.root):
@@ -121,20 +175,25 @@ class FoldTopology:
         # Build connections between points
         for p1 in self.points:
             connections = []
+            energy_1 = energies[p1]
             
             for p2 in self.points:
                 if p2 == p1:
                     continue
                 
-                # Sample energy along path between p1 and p2
-                mid_points = [int(p1 + t * (p2 - p1)) for t in [0.25, 0.5, 0.75]]
-                path_energies = [energies.get(m, fold_energy(self.n, m)) for m in mid_points]
+                # Sample energy at 1/4, 1/2 and 3/4 of the path between p1
+                # and p2. Floor shifts give the same integer midpoints as
+                # int(p1 + t * (p2 - p1)); they lie between two minima in
+                # [3, root), so are always tabulated.
+                span = p2 - p1
                 
                 # Average energy along path
-                avg_path_energy = sum(path_energies) / len(path_energies)
+                avg_path_energy = (energies[p1 + (span >> 2)] +
+                                   energies[p1 + (span >> 1)] +
+                                   energies[p1 + ((3 * span) >> 2)]) / 3
                 
                 # Energy at endpoints
-                endpoint_energy = (energies[p1] + energies[p2]) / 2
+                endpoint_energy = (energy_1 + energies[p2]) / 2
                 
                 # Connect if path doesn't go too high above endpoints
                 if avg_path_energy < endpoint_energy * 1.5:
@@ -151,27 +210,28 @@ class FoldTopology:
         Returns:
             List of components, each containing connected points
         """
-        components = []
-        unvisited = set(self.points)
+        # Union-find over the connection edges; each root is the smallest
+        # point of its component, with paths halved on lookup
+        parent = {p: p for p in self.points}
         
-        while unvisited:
-            # Start new component
-            component = []
-            stack = [unvisited.pop()]
-            
-            while stack:
-                current = stack.pop()
-                component.append(current)
-                
-                # Add connected neighbors
-                for neighbor, _ in self.connections.get(current, []):
-                    if neighbor in unvisited:
-                        unvisited.remove(neighbor)
-                        stack.append(neighbor)
-            
-            components.append(sorted(component))
+        def find(p: int) -> int:
+            while parent[p] != p:
+                parent[p] = parent[parent[p]]
+                p = parent[p]
+            return p
+        
+        for p1, neighbors in self.connections.items():
+            for p2, _ in neighbors:
+                r1, r2 = find(p1), find(p2)
+                if r1 != r2:
+                    parent[max(r1, r2)] = min(r1, r2)
         
-        return components
+        # Points are ascending, so every component comes out sorted
+        groups: Dict[int, List[int]] = {}
+        for p in self.points:
+            groups.setdefault(find(p), []).append(p)
+        
+        return list(groups.values())
     
     def traverse(self) -> List[int]:
         """
@@ -183,8 +243,9 @@ class FoldTopology:
         if not self.points:
             return []
         
-        # Start from lowest energy point
-        current = min(self.points, key=lambda x: fold_energy(self.n, x))
+        # Start from lowest energy point, sharing S(n) across all points
+        energies = fold_energy_batch(self.n, self.points)
+        current = self.points[energies.index(min(energies))]
         visited = set()
         path = []
         
@@ -220,16 +281,16 @@ def find_energy_valleys(n: int, resolution: int = 100) -> List[int]:
     Returns:
         List of valley positions
     """
-    root = int(math.isqrt(n))
+    root = math.isqrt(n)
     step = max(1, root // resolution)
     
     valleys = []
     prev_energy = float('inf')
-    current_energy = fold_energy(n, 2)
     
-    for x in range(3, root + 1, step):
-        next_energy = fold_energy(n, x)
-        
+    positions = range(3, root + 1, step)
+    current_energy, *energies = fold_energy_batch(n, [2, *positions])
+    
+    for x, next_energy in zip(positions, energies):
         # Check for local minimum
         if current_energy < prev_energy and current_energy < next_energy:
             valleys.append(x - step)
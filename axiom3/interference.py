@@ -3,17 +3,91 @@ Interference - Prime×Fibonacci wave interference patterns
 Analyzes interference between prime and Fibonacci waves
 """
 
+import heapq
 import math
+from bisect import bisect_right
+from itertools import repeat
 from typing import List, Tuple
 
 # Import dependencies from other axioms
 import sys
 import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.append(_ROOT)
 from axiom1 import primes_up_to
 from axiom2 import fib, PHI
 
-def prime_fib_interference(n: int) -> List[float]:
+# Minimum positions per worker process: below this, starting the pool
+# costs more than evaluating the span serially
+_PARALLEL_MIN_SPAN = 25_000
+
+# Wave sources, computed once: F(2)..F(39) and the primes up to 100
+_FIB_TABLE = tuple(fib(k) for k in range(2, 40))
+_PRIME_TABLE = tuple(primes_up_to(100))
+
+def _wave_sources(root: int) -> Tuple[List[int], List[int]]:
+    """
+    Primes and Fibonacci numbers that generate the waves for a given root
+    
+    Uses the first 10 primes and first 10 Fibonacci numbers up to root.
+    """
+    primes = list(_PRIME_TABLE[:min(10, bisect_right(_PRIME_TABLE, root))])
+    fibs = list(_FIB_TABLE[:min(10, bisect_right(_FIB_TABLE, root))])
+    return primes, fibs
+
+def _wave_frequencies(n: int, root: int) -> Tuple[List[float], List[float]]:
+    """
+    Angular frequencies of the prime and Fibonacci waves for n
+    
+    Pre-multiplies 2π·p/n and 2π·f/(n·φ) once per n so evaluating a
+    position costs one multiply and one cosine per wave.
+    """
+    primes, fibs = _wave_sources(root)
+    prime_scale = 2 * math.pi / n
+    fib_scale = 2 * math.pi / (n * PHI)
+    return [prime_scale * p for p in primes], [fib_scale * f for f in fibs]
+
+def _interference_at(x: int, prime_freqs: List[float], fib_freqs: List[float]) -> float:
+    """Interference value at a single position x"""
+    # Prime wave component
+    prime_amp = sum(math.cos(k * x) for k in prime_freqs)
+    
+    # Fibonacci wave component (scaled by golden ratio)
+    fib_amp = sum(math.cos(k * x) for k in fib_freqs)
+    
+    # Interference is the product
+    return prime_amp * fib_amp
+
+def _interference_span(prime_freqs: List[float], fib_freqs: List[float],
+                       start: int, stop: int) -> List[float]:
+    """
+    Compute interference values for positions x in [start, stop)
+
+    Each position is independent of every other, so disjoint spans can
+    be evaluated in separate processes and concatenated in order.
+    
+    Same values as _interference_at per position; the sums are written
+    as plain loops with cos bound locally, which avoids a function call
+    and two generators per position.
+    """
+    cos = math.cos
+    values = []
+    
+    for x in range(start, stop):
+        prime_amp = 0.0
+        for k in prime_freqs:
+            prime_amp += cos(k * x)
+        
+        fib_amp = 0.0
+        for k in fib_freqs:
+            fib_amp += cos(k * x)
+        
+        values.append(prime_amp * fib_amp)
+    
+    return values
+
+def prime_fib_interference(n: int, workers: int = 1) -> List[float]:
     """
     Generate interference pattern from prime and Fibonacci waves
     
@@ -23,43 +97,38 @@ def prime_fib_interference(n: int) -> List[float]:
     
     Args:
         n: Number being analyzed
+        workers: Processes to spread the pattern over (1 keeps it serial).
+            Callers using the spawn or forkserver start methods must
+            guard their entry point with __main__.
         
     Returns:
         List of interference values across the search space
     """
-    root = int(math.isqrt(n))
+    root = math.isqrt(n)
     
-    # Get primes and Fibonacci numbers for waves
-    primes = primes_up_to(min(root, 100))[:10]  # Use first 10 primes
+    # Get wave frequencies from primes and Fibonacci numbers
+    prime_freqs, fib_freqs = _wave_frequencies(n, root)
     
-    # Get Fibonacci numbers up to root
-    fibs = []
-    k = 2
-    while True:
-        f = fib(k)
-        if f > root:
-            break
-        fibs.append(f)
-        k += 1
+    # Generate interference pattern, giving each worker at least
+    # _PARALLEL_MIN_SPAN positions
+    workers = min(workers, (root - 1) // _PARALLEL_MIN_SPAN)
     
-    # Limit to first 10 Fibonacci numbers
-    fibs = fibs[:10]
+    if workers < 2:
+        return _interference_span(prime_freqs, fib_freqs, 2, root + 1)
     
-    # Generate interference pattern
-    spectrum = []
+    # Large search space: evaluate contiguous spans in parallel
+    chunk = -(-(root - 1) // workers)
+    starts = range(2, root + 1, chunk)
+    stops = [min(start + chunk, root + 1) for start in starts]
     
-    for x in range(2, root + 1):
-        # Prime wave component
-        prime_amp = sum(math.cos(2 * math.pi * p * x / n) for p in primes)
-        
-        # Fibonacci wave component (scaled by golden ratio)
-        fib_amp = sum(math.cos(2 * math.pi * f * x / (n * PHI)) for f in fibs)
-        
-        # Interference is the product
-        interference = prime_amp * fib_amp
-        spectrum.append(interference)
+    # Deferred so that importing axiom3 (and the serial path above) never
+    # loads the process pool machinery
+    from concurrent.futures import ProcessPoolExecutor
     
-    return spectrum
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        spans = pool.map(_interference_span, repeat(prime_freqs),
+                         repeat(fib_freqs), starts, stops)
+        return [value for span in spans for value in span]
 
 def interference_extrema(n: int, top: int = 30) -> List[int]:
     """
@@ -75,30 +144,37 @@ def interference_extrema(n: int, top: int = 30) -> List[int]:
     Returns:
         List of positions with strongest extrema
     """
-    spectrum = prime_fib_interference(n)
+    return interference_extrema_from(prime_fib_interference(n), top)
+
+def interference_extrema_from(spectrum: List[float], top: int = 30) -> List[int]:
+    """
+    Find extrema in an already computed interference pattern
+    
+    Lets callers that hold the pattern (e.g. caches) derive its extrema
+    without evaluating the interference waves a second time.
     
+    Args:
+        spectrum: Output of prime_fib_interference(n)
+        top: Number of extrema to return
+        
+    Returns:
+        List of positions with strongest extrema
+    """
     if len(spectrum) < 3:
         return []
     
-    # Find all extrema (local maxima and minima)
-    extrema = []
-    
-    for i in range(1, len(spectrum) - 1):
-        # Check if local maximum or minimum
-        if ((spectrum[i] > spectrum[i-1] and spectrum[i] > spectrum[i+1]) or
-            (spectrum[i] < spectrum[i-1] and spectrum[i] < spectrum[i+1])):
-            
-            # Position is i+2 because spectrum starts at x=2
-            position = i + 2
-            # Weight by absolute value of extremum
-            weight = abs(spectrum[i])
-            extrema.append((weight, position))
+    # Slopes between neighbouring samples; an extremum (local maximum or
+    # minimum) sits wherever consecutive slopes change sign
+    slopes = [b - a for a, b in zip(spectrum, spectrum[1:])]
     
-    # Sort by weight (strongest extrema first)
-    extrema.sort(reverse=True)
+    # Weight by absolute value of extremum; position is i+2 because
+    # spectrum starts at x=2
+    extrema = [(abs(spectrum[i]), i + 2)
+               for i, (left, right) in enumerate(zip(slopes, slopes[1:]), 1)
+               if left < 0 < right or right < 0 < left]
     
-    # Return positions only
-    return [pos for _, pos in extrema[:top]]
+    # Strongest extrema first; only the top entries need ordering
+    return [pos for _, pos in heapq.nlargest(top, extrema)]
 
 def identify_resonance_source(x: int, n: int) -> Tuple[int, int]:
     """
@@ -113,38 +189,39 @@ def identify_resonance_source(x: int, n: int) -> Tuple[int, int]:
     Returns:
         Tuple of (prime, fibonacci) that create strongest resonance
     """
-    root = int(math.isqrt(n))
+    root = math.isqrt(n)
     
     # Get candidate primes
-    primes = [p for p in primes_up_to(min(root, 100)) if x % p != 0]
+    primes = [p for p in _PRIME_TABLE[:bisect_right(_PRIME_TABLE, root)]
+              if x % p != 0]
     if not primes:
         primes = [2]  # Fallback
     
-    # Get candidate Fibonacci numbers
-    fibs = []
-    k = 2
-    while k < 20 and fib(k) <= root:
-        fibs.append(fib(k))
-        k += 1
+    # Get candidate Fibonacci numbers F(2)..F(19) up to root
+    fibs = list(_FIB_TABLE[:min(18, bisect_right(_FIB_TABLE, root))])
     if not fibs:
         fibs = [2]  # Fallback
     
-    # Find strongest resonance
-    best_resonance = 0
-    best_prime = primes[0]
-    best_fib = fibs[0]
+    # Wave components depend on only one source each: compute them once
+    prime_components = [abs(math.cos(2 * math.pi * p * x / n)) for p in primes]
+    fib_components = [abs(math.cos(2 * math.pi * f * x / (n * PHI))) for f in fibs]
     
-    for p in primes:
-        for f in fibs:
-            # Calculate resonance strength
-            prime_component = abs(math.cos(2 * math.pi * p * x / n))
-            fib_component = abs(math.cos(2 * math.pi * f * x / (n * PHI)))
-            resonance = prime_component * fib_component
-            
-            if resonance > best_resonance:
-                best_resonance = resonance
-                best_prime = p
-                best_fib = f
+    # Resonance is the product of two non-negative components, so each
+    # prime's strongest pairing is with the largest Fibonacci component.
+    # Take the first prime reaching the overall best, then the first
+    # Fibonacci number reaching it for that prime, as a full grid scan would.
+    fib_peak = max(fib_components)
+    row_peaks = [component * fib_peak for component in prime_components]
+    best_resonance = max(row_peaks)
+    
+    if best_resonance <= 0:
+        return (primes[0], fibs[0])
+    
+    i = row_peaks.index(best_resonance)
+    prime_component = prime_components[i]
+    best_prime = primes[i]
+    best_fib = next(f for f, fib_component in zip(fibs, fib_components)
+                    if prime_component * fib_component == best_resonance)
     
     return (best_prime, best_fib)
 
@@ -163,26 +240,19 @@ def interference_gradient(n: int, x: int, delta: int = 1) -> float:
     Returns:
         Gradient value
     """
-    root = int(math.isqrt(n))
+    root = math.isqrt(n)
     
     # Ensure x is in valid range
     if x - delta < 2 or x + delta > root:
         return 0.0
     
-    # Get interference values
-    spectrum = prime_fib_interference(n)
-    
-    # Map x to spectrum index (spectrum starts at x=2)
-    idx = x - 2
-    idx_minus = (x - delta) - 2
-    idx_plus = (x + delta) - 2
-    
-    # Bounds check
-    if idx_minus < 0 or idx_plus >= len(spectrum):
-        return 0.0
+    # Only the two samples at x±delta are needed, not the whole spectrum
+    prime_freqs, fib_freqs = _wave_frequencies(n, root)
+    value_plus = _interference_at(x + delta, prime_freqs, fib_freqs)
+    value_minus = _interference_at(x - delta, prime_freqs, fib_freqs)
     
     # Finite difference gradient
-    gradient = (spectrum[idx_plus] - spectrum[idx_minus]) / (2 * delta)
+    gradient = (value_plus - value_minus) / (2 * delta)
     
     return gradient
 
@@ -202,8 +272,8 @@ def resonance_strength(p: int, q: int, n: int) -> float:
         Resonance strength (0 to 1)
     """
     # Get some primes and Fibonacci numbers
-    primes = primes_up_to(30)[:5]
-    fibs = [fib(k) for k in range(2, 7)]
+    primes = _PRIME_TABLE[:5]
+    fibs = _FIB_TABLE[:5]
     
     strength = 0.0
     count = 0
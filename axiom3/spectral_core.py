@@ -4,15 +4,26 @@ Implements binary, modular, digital, and harmonic spectra
 """
 
 import math
-import itertools
 from typing import List
 
 # Import dependencies from other axioms
 import sys
 import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.append(_ROOT)
 from axiom1 import primes_up_to
-from axiom2 import PHI, GOLDEN_ANGLE, fib_wave
+from axiom2 import PHI, GOLDEN_ANGLE, fib, fib_wave
+
+# Odd primes below 50, the moduli used by modular_spectrum for k <= 16
+_MODULAR_PRIMES = tuple(primes_up_to(50)[1:])
+
+# Constants used by harmonic_spectrum on every call
+_LOG_PHI = math.log(PHI)
+_TWO_PI = 2 * math.pi
+
+# F(0)..F(127): covers the nearest Fibonacci index for n below ~10^26
+_FIB = tuple(fib(k) for k in range(128))
 
 def binary_spectrum(n: int) -> List[float]:
     """
@@ -40,32 +51,45 @@ def binary_spectrum(n: int) -> List[float]:
     ones_count = bits.count('1')
     density = ones_count / length
     
-    # Convert to +1/-1 sequence for autocorrelation
-    sequence = [1 if b == '1' else -1 for b in bits]
-    mean = sum(sequence) / length
-    
-    # Compute autocorrelation at lag 1
+    # Autocorrelation at lag 1 of the +1/-1 bit sequence, in closed form.
+    # Every term squares to 1, so the variance is 1 - mean², and the lagged
+    # products sum to (length - 1) - 2*transitions. The leading bit is
+    # always +1 and the last bit is +1 exactly when n is odd.
     if length > 1:
-        autocorr = sum((sequence[i] - mean) * (sequence[i + 1] - mean) 
-                      for i in range(length - 1)) / (length - 1)
+        total = 2 * ones_count - length
+        mean = total / length
+        transitions = bin(n ^ (n >> 1)).count('1') - 1
+        last = 1 if n & 1 else -1
+        lagged = (length - 1) - 2 * transitions
+        autocorr = (lagged - mean * (2 * total - 1 - last)
+                    + (length - 1) * mean * mean) / (length - 1)
         # Normalize
-        variance = sum((x - mean) ** 2 for x in sequence) / length
-        autocorr = autocorr / variance if variance > 0 else 0
+        variance = 1 - mean * mean
+        autocorr = autocorr / variance if variance > 0 else 0.0
     else:
-        autocorr = 0
+        autocorr = 0.0
     
-    # Run lengths (normalized by total length)
+    # Run lengths (normalized by total length); only the first 10 are used.
+    # Runs alternate starting with 1s, so each one is peeled off with a
+    # C-level lstrip instead of grouping bit by bit; a run's length is the
+    # drop in remaining length.
     runs = []
-    for bit, group in itertools.groupby(bits):
-        run_length = len(list(group)) / length
-        runs.append(run_length)
-    
-    # Return density, autocorrelation, and first 10 run lengths
-    spectrum = [density, autocorr] + runs[:10]
+    rest = bits
+    remaining = length
+    for digit in '1010101010':
+        rest = rest.lstrip(digit)
+        stripped = len(rest)
+        runs.append((remaining - stripped) / length)
+        if not stripped:
+            break
+        remaining = stripped
     
-    # Pad with zeros if needed
-    while len(spectrum) < 12:
-        spectrum.append(0.0)
+    # Return density, autocorrelation, and first 10 run lengths,
+    # zero-padded to a fixed 12 features
+    spectrum = [0.0] * 12
+    spectrum[0] = density
+    spectrum[1] = autocorr
+    spectrum[2:2 + len(runs)] = runs
     
     return spectrum
 
@@ -87,17 +111,13 @@ def modular_spectrum(n: int, k: int = 10) -> List[float]:
         return [0.0] * k
     
     # Get enough primes, skipping 2 for better patterns
-    all_primes = primes_up_to(max(50, 3 * k))
-    primes = all_primes[1:]  # Skip 2
+    if 3 * k <= 50:
+        primes = _MODULAR_PRIMES[:k]
+    else:
+        primes = primes_up_to(3 * k)[1:k + 1]  # Skip 2
     
-    # Compute normalized residues
-    spectrum = []
-    for i, p in enumerate(primes):
-        if i >= k:
-            break
-        residue = n % p
-        normalized = residue / p  # Range [0, 1)
-        spectrum.append(normalized)
+    # Compute normalized residues, each in range [0, 1)
+    spectrum = [(n % p) / p for p in primes]
     
     # Ensure we have exactly k values
     while len(spectrum) < k:
@@ -122,21 +142,20 @@ def digital_spectrum(n: int) -> List[float]:
     if n <= 0:
         return [0.0, 0.0]
     
-    # Get digits
-    digits = [int(d) for d in str(n)]
+    # Digit sum and digit count by repeated division, without building a string
+    digit_sum = 0
+    num_digits = 0
+    m = n
+    while m:
+        m, d = divmod(m, 10)
+        digit_sum += d
+        num_digits += 1
     
     # Digit sum normalized by number of digits × 9
-    digit_sum = sum(digits)
-    normalized_sum = digit_sum / (len(digits) * 9)
-    
-    # Digital root
-    root = digit_sum
-    while root >= 10:
-        root = sum(int(d) for d in str(root))
+    normalized_sum = digit_sum / (num_digits * 9)
     
-    # Special case: digital root 0 only for n=0
-    if root == 0 and n != 0:
-        root = 9
+    # Digital root in closed form; digit_sum >= 1 since n > 0
+    root = 1 + (digit_sum - 1) % 9
     
     normalized_root = root / 9
     
@@ -160,8 +179,8 @@ def harmonic_spectrum(n: int) -> List[float]:
     if n <= 1:
         return [0.0, 0.0, 0.0]
     
-    # Position in Fibonacci space
-    x = math.log(max(n, 1)) / math.log(PHI)
+    # Position in Fibonacci space (n > 1 here)
+    x = math.log(n) / _LOG_PHI
     
     # Fibonacci wave value at this position
     wave_value = fib_wave(x)
@@ -171,22 +190,63 @@ def harmonic_spectrum(n: int) -> List[float]:
     phase = abs(wave_value) % 1 if not isinstance(wave_value, complex) else abs(wave_value.real) % 1
     
     # Find nearest Fibonacci number
-    from axiom2 import fib
-    k = round(x)
-    nearest_fib = fib(max(0, k))
+    k = max(0, round(x))
+    nearest_fib = _FIB[k] if k < len(_FIB) else fib(k)
     
     # Normalized distance to nearest Fibonacci
     distance = abs(n - nearest_fib)
     normalized_distance = distance / (n + 1)  # Avoid division by zero
     
     # Ratio to nearest Fibonacci
-    ratio = math.log(nearest_fib + 1) / math.log(n + 1) if nearest_fib > 0 else 0
+    ratio = math.log(nearest_fib + 1) / math.log(n + 1) if nearest_fib > 0 else 0.0
     
     # Golden angle offset
-    offset = (n * GOLDEN_ANGLE / (2 * math.pi)) % 1
+    offset = (n * GOLDEN_ANGLE / _TWO_PI) % 1
     
     return [phase, ratio, offset]
 
+def spectral_distance(sa: List[float], sb: List[float], sn: List[float]) -> float:
+    """
+    Squared distance ||S(a) + S(b) - 2*S(n)||² between spectral vectors
+    
+    Shared kernel of coherence and fold energy: for a true factorization
+    a×b = n the two factor spectra combine to roughly twice S(n).
+    
+    Args:
+        sa: Spectral vector S(a)
+        sb: Spectral vector S(b)
+        sn: Spectral vector S(n)
+        
+    Returns:
+        Squared distance (0 for a perfect match)
+    """
+    # An indexed loop beats zip/sum comprehensions for 27-element vectors
+    total = 0.0
+    for i in range(len(sa)):
+        diff = sa[i] + sb[i] - 2 * sn[i]
+        total += diff * diff
+    return total
+
+def spectral_self_distance(sa: List[float], sn: List[float]) -> float:
+    """
+    spectral_distance(sa, sa, sn) for the square case a×a, in half the work
+    
+    ||2S(a) - 2S(n)||² is 4·||S(a) - S(n)||², and scaling by a power of two
+    is exact in floating point, so the result matches spectral_distance.
+    
+    Args:
+        sa: Spectral vector S(a)
+        sn: Spectral vector S(n)
+        
+    Returns:
+        Squared distance (0 for a perfect match)
+    """
+    total = 0.0
+    for i in range(len(sa)):
+        diff = sa[i] - sn[i]
+        total += diff * diff
+    return 4 * total
+
 def spectral_vector(n: int) -> List[float]:
     """
     Combine all spectral representations into a single vector
@@ -203,7 +263,9 @@ def spectral_vector(n: int) -> List[float]:
     Returns:
         Combined spectral vector
     """
-    return (binary_spectrum(n) + 
-            modular_spectrum(n) + 
-            digital_spectrum(n) + 
-            harmonic_spectrum(n))
+    # Extend the fresh binary spectrum in place rather than concatenating
+    vector = binary_spectrum(n)
+    vector += modular_spectrum(n)
+    vector += digital_spectrum(n)
+    vector += harmonic_spectrum(n)
+    return vector
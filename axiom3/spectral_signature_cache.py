@@ -3,44 +3,158 @@ Spectral Signature Cache - Acceleration for Duality Principle
 Caches spectral vectors, coherence values, and interference patterns
 """
 
+import heapq
 import math
-from typing import Dict, Tuple, List, Optional
+from array import array
+from typing import Dict, Tuple, List, Optional, Any, Iterator
 from collections import OrderedDict
+from collections.abc import MutableMapping
 
 # Import spectral computation functions
-from .spectral_core import spectral_vector
-from .coherence import coherence, CoherenceCache
-from .interference import prime_fib_interference, interference_extrema
+from .spectral_core import spectral_vector, spectral_distance, spectral_self_distance
+from .coherence import coherence, CoherenceCache, SATURATION_DISTANCE
+from .interference import prime_fib_interference, interference_extrema_from
 from .fold_topology import FoldTopology
 
 # Import axiom integration
 import sys
 import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.append(_ROOT)
 from axiom1 import primes_up_to, is_prime
 from axiom2 import fib, PHI
 
 
+class SegmentedLRU(MutableMapping):
+    """
+    Segmented LRU mapping with probationary and protected segments
+    
+    New entries enter the probationary segment. A hit (move_to_end)
+    promotes an entry to the protected segment, so values reused across
+    scans - small primes, Fibonacci numbers, the target n - survive a
+    sweep of one-off entries. Eviction (popitem) drains probation first.
+    
+    Mirrors the OrderedDict calls used by SpectralSignatureCache:
+    move_to_end to record a hit and popitem(last=False) to evict.
+    """
+    
+    def __init__(self, protected_size: int):
+        """
+        Args:
+            protected_size: Maximum entries in the protected segment
+        """
+        self.protected_size = protected_size
+        self.probation = OrderedDict()
+        self.protected = OrderedDict()
+        
+    def __getitem__(self, key: Any) -> Any:
+        if key in self.protected:
+            return self.protected[key]
+        return self.probation[key]
+        
+    def __setitem__(self, key: Any, value: Any):
+        if key in self.protected:
+            self.protected[key] = value
+        else:
+            self.probation[key] = value
+            
+    def __delitem__(self, key: Any):
+        if key in self.protected:
+            del self.protected[key]
+        else:
+            del self.probation[key]
+            
+    def __contains__(self, key: Any) -> bool:
+        return key in self.protected or key in self.probation
+        
+    def __iter__(self) -> Iterator[Any]:
+        yield from self.probation
+        yield from self.protected
+        
+    def __len__(self) -> int:
+        return len(self.probation) + len(self.protected)
+        
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Return the value for key without recording a hit"""
+        value = self.protected.get(key)
+        if value is not None:
+            return value
+        return self.probation.get(key, default)
+        
+    def lookup(self, key: Any) -> Any:
+        """
+        Return the value for key and record the hit, or None if absent
+        
+        Single-call form of the `key in cache`, move_to_end, cache[key]
+        sequence; protected hits cost one dict probe and one relink.
+        """
+        value = self.protected.get(key)
+        if value is not None:
+            self.protected.move_to_end(key)
+            return value
+            
+        if key in self.probation:
+            self.move_to_end(key)
+            return self.protected[key]
+            
+        return None
+        
+    def move_to_end(self, key: Any):
+        """Record a hit: promote to (or refresh within) the protected segment"""
+        if key in self.protected:
+            self.protected.move_to_end(key)
+            return
+            
+        self.protected[key] = self.probation.pop(key)
+        
+        # Demote the coldest protected entry back to probation
+        if len(self.protected) > self.protected_size:
+            demoted, value = self.protected.popitem(last=False)
+            self.probation[demoted] = value
+            
+    def popitem(self, last: bool = True) -> Tuple[Any, Any]:
+        """Evict from probation first, then from the protected segment"""
+        if self.probation:
+            return self.probation.popitem(last=last)
+        return self.protected.popitem(last=last)
+        
+    def clear(self):
+        self.probation.clear()
+        self.protected.clear()
+
+
 class SpectralSignatureCache:
     """
     Accelerates spectral analysis through intelligent caching
     of spectral signatures and derived computations.
     """
     
-    def __init__(self, cache_size: int = 10000):
+    def __init__(self, cache_size: int = 10000, compact: bool = False):
         """
         Initialize cache with specified size limit
         
         Args:
             cache_size: Maximum number of entries per cache type
+            compact: Store spectral vectors as float32, halving their
+                memory at ~1e-7 relative precision. Off by default so
+                cached results stay exact.
         """
         self.cache_size = cache_size
+        self.compact = compact
+        self._typecode = 'f' if compact else 'd'
         
-        # LRU caches using OrderedDict
-        self.spectral_cache = OrderedDict()  # n -> S(n)
+        # LRU caches using OrderedDict; spectral vectors and fold maps use
+        # a segmented LRU so reused entries survive one-off scans
+        protected_size = max(1, cache_size * 4 // 5)
+        self.spectral_cache = SegmentedLRU(protected_size)  # n -> S(n) as array
         self.coherence_cache = OrderedDict()  # (a,b,n) -> coherence
         self.interference_bank = OrderedDict()  # n -> (pattern, extrema)
-        self.fold_map = OrderedDict()  # n -> {pos: energy}
+        self.fold_map = SegmentedLRU(protected_size)  # n -> {pos: energy}
+        
+        # Priority vectors stay resident outside the LRU, so an evicted
+        # priority number is restored without recomputing S(n)
+        self.priority_spectra: Dict[int, array] = {}
         
         # Statistics for meta-observation
         self.cache_hits = 0
@@ -67,37 +181,42 @@ class SpectralSignatureCache:
             self._ensure_spectral_cached(2**i)
             
     def _ensure_spectral_cached(self, n: int):
-        """Ensure spectral vector is cached for n"""
+        """Ensure spectral vector is cached for priority number n"""
+        vector = self.priority_spectra.get(n)
+        if vector is None:
+            vector = self.priority_spectra[n] = array(self._typecode, spectral_vector(n))
+            
         if n not in self.spectral_cache:
-            self.spectral_cache[n] = spectral_vector(n)
+            self.spectral_cache[n] = vector
             self._enforce_cache_limit(self.spectral_cache)
             
-    def _enforce_cache_limit(self, cache: OrderedDict):
+    def _enforce_cache_limit(self, cache: MutableMapping):
         """Enforce LRU eviction when cache exceeds size limit"""
         while len(cache) > self.cache_size:
             # Remove least recently used (first item)
             cache.popitem(last=False)
             
-    def get_spectral_vector(self, n: int) -> List[float]:
+    def _spectral_array(self, n: int) -> array:
         """
-        Get spectral vector with caching
+        Get the cached spectral vector of n as stored
         
-        Args:
-            n: Number to analyze
-            
-        Returns:
-            Spectral vector S(n)
+        Vectors are kept as contiguous array('d') buffers (array('f') when
+        compact), a third or less of the memory of a list of float
+        objects. They must not be mutated; get_spectral_vector hands out
+        list copies.
         """
-        if n in self.spectral_cache:
+        # Lookup also marks n as most recently used
+        cached = self.spectral_cache.lookup(n)
+        if cached is not None:
             self.cache_hits += 1
-            # Move to end (most recently used)
-            self.spectral_cache.move_to_end(n)
-            return self.spectral_cache[n]
+            return cached
             
         self.cache_misses += 1
         
-        # Compute spectral vector
-        spec_vector = spectral_vector(n)
+        # Restore a priority vector or compute the spectral vector
+        spec_vector = self.priority_spectra.get(n)
+        if spec_vector is None:
+            spec_vector = array(self._typecode, spectral_vector(n))
         
         # Cache it
         self.spectral_cache[n] = spec_vector
@@ -105,6 +224,18 @@ class SpectralSignatureCache:
         
         return spec_vector
         
+    def get_spectral_vector(self, n: int) -> List[float]:
+        """
+        Get spectral vector with caching
+        
+        Args:
+            n: Number to analyze
+            
+        Returns:
+            Spectral vector S(n)
+        """
+        return self._spectral_array(n).tolist()
+        
     def get_coherence(self, a: int, b: int, n: int) -> float:
         """
         Get coherence value with caching and symmetry exploitation
@@ -117,28 +248,30 @@ class SpectralSignatureCache:
             Coherence value C(a,b,n)
         """
         # Exploit symmetry: C(a,b,n) = C(b,a,n)
-        key = tuple(sorted([a, b]) + [n])
+        key = (a, b, n) if a <= b else (b, a, n)
         
-        if key in self.coherence_cache:
+        cached = self.coherence_cache.get(key)
+        if cached is not None:
             self.cache_hits += 1
             self.coherence_cache.move_to_end(key)
-            return self.coherence_cache[key]
+            return cached
             
         self.cache_misses += 1
         
         # Get spectral vectors (may hit cache)
-        s_a = self.get_spectral_vector(a)
-        s_b = self.get_spectral_vector(b)
-        s_n = self.get_spectral_vector(n)
+        s_a = self._spectral_array(a)
+        s_b = self._spectral_array(b)
+        s_n = self._spectral_array(n)
         
         # Compute coherence
         # C(a,b,n) = exp(-||S(a)+S(b)-2S(n)||²)
-        diff_squared = 0
-        for i in range(len(s_a)):
-            diff = s_a[i] + s_b[i] - 2 * s_n[i]
-            diff_squared += diff * diff
+        diff_squared = spectral_distance(s_a, s_b, s_n)
             
-        coherence = math.exp(-diff_squared)
+        # Saturated distances have effectively zero coherence
+        if diff_squared > SATURATION_DISTANCE:
+            coherence = 0.0
+        else:
+            coherence = math.exp(-diff_squared)
         
         # Cache it
         self.coherence_cache[key] = coherence
@@ -146,6 +279,90 @@ class SpectralSignatureCache:
         
         return coherence
         
+    def get_self_coherence(self, a: int, n: int) -> float:
+        """
+        Get coherence C(a, a, n) with caching
+        
+        Equivalent to get_coherence(a, a, n), sharing its cache entries, but
+        fetches S(a) once and uses the square-case distance kernel.
+        
+        Args:
+            a: Number to check as a square root of n
+            n: Target number
+            
+        Returns:
+            Coherence value C(a,a,n)
+        """
+        key = (a, a, n)
+        
+        cached = self.coherence_cache.get(key)
+        if cached is not None:
+            self.cache_hits += 1
+            self.coherence_cache.move_to_end(key)
+            return cached
+            
+        self.cache_misses += 1
+        
+        diff_squared = spectral_self_distance(self._spectral_array(a),
+                                              self._spectral_array(n))
+        
+        # Saturated distances have effectively zero coherence
+        if diff_squared > SATURATION_DISTANCE:
+            coherence = 0.0
+        else:
+            coherence = math.exp(-diff_squared)
+        
+        self.coherence_cache[key] = coherence
+        self._enforce_cache_limit(self.coherence_cache)
+        
+        return coherence
+        
+    def get_coherence_batch(self, factors: List[int], n: int) -> List[float]:
+        """
+        Get coherence C(x, n/x, n) for each factor x of n in one pass
+        
+        Equivalent to calling get_coherence(x, n // x, n) per factor, but
+        S(n) is fetched once and shared by every uncached entry.
+        
+        Args:
+            factors: Divisors of n
+            n: Target number
+            
+        Returns:
+            Coherence values in the order of factors
+        """
+        s_n = self._spectral_array(n)
+        values = []
+        
+        for x in factors:
+            y = n // x
+            key = (x, y, n) if x <= y else (y, x, n)
+            
+            cached = self.coherence_cache.get(key)
+            if cached is not None:
+                self.cache_hits += 1
+                self.coherence_cache.move_to_end(key)
+                values.append(cached)
+                continue
+                
+            self.cache_misses += 1
+            
+            diff_squared = spectral_distance(self._spectral_array(x),
+                                             self._spectral_array(y), s_n)
+            
+            # Saturated distances have effectively zero coherence
+            if diff_squared > SATURATION_DISTANCE:
+                coherence = 0.0
+            else:
+                coherence = math.exp(-diff_squared)
+            
+            self.coherence_cache[key] = coherence
+            values.append(coherence)
+        
+        self._enforce_cache_limit(self.coherence_cache)
+        
+        return values
+        
     def get_interference_pattern(self, n: int) -> Tuple[List[float], List[int]]:
         """
         Get interference pattern with caching
@@ -156,18 +373,19 @@ class SpectralSignatureCache:
         Returns:
             (interference_values, extrema_positions)
         """
-        if n in self.interference_bank:
+        cached = self.interference_bank.get(n)
+        if cached is not None:
             self.cache_hits += 1
             self.interference_bank.move_to_end(n)
-            return self.interference_bank[n]
+            return cached
             
         self.cache_misses += 1
         
         # Get the interference pattern
         pattern = prime_fib_interference(n)
         
-        # Get extrema positions
-        extrema = interference_extrema(n)
+        # Get extrema positions from the same pattern
+        extrema = interference_extrema_from(pattern)
                 
         # Cache it
         self.interference_bank[n] = (pattern, extrema)
@@ -186,48 +404,75 @@ class SpectralSignatureCache:
         Returns:
             Fold energy E(x)
         """
-        if n in self.fold_map and x in self.fold_map[n]:
-            self.cache_hits += 1
-            return self.fold_map[n][x]
+        energies = self.fold_map.get(n)
+        if energies is not None:
+            cached = energies.get(x)
+            if cached is not None:
+                self.cache_hits += 1
+                self.fold_map.move_to_end(n)
+                return cached
             
         self.cache_misses += 1
         
         # Initialize fold map for n if needed
-        if n not in self.fold_map:
-            self.fold_map[n] = {}
+        if energies is None:
+            energies = self.fold_map[n] = {}
             
         # Get spectral vectors (may hit cache)
-        s_x = self.get_spectral_vector(x)
-        s_n = self.get_spectral_vector(n)
+        s_x = self._spectral_array(x)
+        s_n = self._spectral_array(n)
         
-        # Handle division
-        if n % x == 0:
-            y = n // x
-        else:
-            # For non-factors, use approximate complementary value
-            y = n / x
-            
-        s_nx = self.get_spectral_vector(int(y))
+        # Complementary value: exact for factors, rounded down otherwise
+        s_nx = self._spectral_array(n // x)
         
         # E(x) = ||S(x) + S(n/x) - 2*S(n)||²
-        energy = 0
-        for i in range(len(s_x)):
-            diff = s_x[i] + s_nx[i] - 2 * s_n[i]
-            energy += diff * diff
+        energy = spectral_distance(s_x, s_nx, s_n)
             
         # Cache it
-        self.fold_map[n][x] = energy
+        energies[x] = energy
         
         # Limit fold map entries per n
-        if len(self.fold_map[n]) > 1000:
+        if len(energies) > 1000:
             # Keep most important positions
-            sorted_positions = sorted(self.fold_map[n].items(), key=lambda x: x[1])[:500]
-            self.fold_map[n] = dict(sorted_positions)
+            lowest = heapq.nsmallest(500, energies.items(), key=lambda x: x[1])
+            self.fold_map[n] = dict(lowest)
             
         self._enforce_cache_limit(self.fold_map)
         
         return energy
         
+    def _fill_fold_map(self, n: int, positions: range):
+        """
+        Compute fold energies for many positions of n in one pass
+        
+        Same values as get_fold_energy(n, x) per position, but the fold
+        map for n and S(n) are looked up once for the whole sweep.
+        """
+        energies = self.fold_map.get(n)
+        if energies is None:
+            energies = self.fold_map[n] = {}
+            self._enforce_cache_limit(self.fold_map)
+            
+        s_n = None
+        
+        for x in positions:
+            if x in energies:
+                self.cache_hits += 1
+                continue
+                
+            self.cache_misses += 1
+            
+            # Fetch S(n) once; later reuses count as hits so statistics
+            # match per-position get_fold_energy calls
+            if s_n is None:
+                s_n = self._spectral_array(n)
+            else:
+                self.cache_hits += 1
+            
+            # Complementary value: exact for factors, rounded down otherwise
+            energies[x] = spectral_distance(self._spectral_array(x),
+                                            self._spectral_array(n // x), s_n)
+        
     def get_sharp_folds(self, n: int) -> List[int]:
         """
         Get pre-identified sharp fold candidates
@@ -241,18 +486,16 @@ class SpectralSignatureCache:
         # Check if we have enough fold data cached
         if n not in self.fold_map or len(self.fold_map[n]) < 10:
             # Build fold map
-            sqrt_n = int(math.isqrt(n))
-            for x in range(2, min(sqrt_n + 1, 100)):
-                self.get_fold_energy(n, x)
+            sqrt_n = math.isqrt(n)
+            self._fill_fold_map(n, range(2, min(sqrt_n + 1, 100)))
                 
         # Find sharp folds from cached data
         if n in self.fold_map:
             energies = [(x, e) for x, e in self.fold_map[n].items() 
                        if e != float('inf')]
-            energies.sort(key=lambda x: x[1])
             
             # Return positions with lowest energy
-            return [x for x, _ in energies[:10]]
+            return [x for x, _ in heapq.nsmallest(10, energies, key=lambda x: x[1])]
         
         return []
         
@@ -267,7 +510,7 @@ class SpectralSignatureCache:
             n: Number to pre-compute for
         """
         # Only pre-compute n itself
-        self.get_spectral_vector(n)
+        self._spectral_array(n)
             
     def get_cache_statistics(self) -> Dict[str, any]:
         """
@@ -10,7 +10,8 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(
 from axiom3.coherence import (
     coherence,
     CoherenceCache,
-    triple_coherence
+    triple_coherence,
+    triple_coherence_batch
 )
 
 def test_coherence_basic():
@@ -79,6 +80,32 @@ def test_coherence_cache():
     # Cache should still work
     coh4 = cache.get_coherence(20, 21, 420)
     assert 0 < coh4 <= 1
+    assert len(cache.coherence_cache) <= 10
+    
+    # Eviction is least recently used: a re-read entry survives
+    lru = CoherenceCache(max_size=2)
+    lru.get_coherence(2, 3, 6)
+    lru.get_coherence(2, 5, 10)
+    lru.get_coherence(3, 2, 6)
+    lru.get_coherence(3, 5, 15)
+    assert (2, 3, 6) in lru.coherence_cache
+    assert (2, 5, 10) not in lru.coherence_cache
+    
+    # A zero-size cache still evaluates, keeping only the latest entry
+    tiny = CoherenceCache(max_size=0)
+    assert tiny.get_coherence(3, 5, 15) == coh1
+    assert tiny.get_coherence(7, 11, 77) == coherence(7, 11, 77)
+    assert list(tiny.coherence_cache) == [(7, 11, 77)]
+    
+    # Keys stay exact beyond 64 bits: operands that agree modulo 2**64
+    # are cached separately
+    wide = CoherenceCache()
+    big = 2**64 + 15
+    wide.get_coherence(3, 5, big)
+    wide.get_coherence(3, 5 + 2**64, big)
+    wide.get_coherence(3, 5, 15)
+    assert list(wide.coherence_cache) == [(3, 5, big), (3, 5 + 2**64, big), (3, 5, 15)]
+    assert wide.get_coherence(3, 5, 15) == coh1
     
     # Test clear
     cache.clear()
@@ -103,8 +130,33 @@ def test_triple_coherence():
     coh_large = triple_coherence(7, 11, 13, 7*11*13)
     assert coh_large >= 0  # Triple coherence can be extremely small
     
+    # Spectrally distant triple saturates to exactly zero
+    assert triple_coherence(30, 123, 63, 2**40) == 0.0
+    
+    # Repeated factors share a spectral vector without changing the value
+    for p, q, r in [(3, 3, 7), (5, 5, 5), (2, 7, 7)]:
+        assert triple_coherence(p, q, r, p*q*r) == triple_coherence_batch([p], [q], [r], p*q*r)[0]
+    
     print("✓ Triple coherence")
 
+def test_triple_coherence_batch():
+    """Test batched triple coherence matches single evaluations"""
+    n = 2 * 3 * 5 * 7
+    triples = [(2, 3, 35), (2, 5, 21), (3, 5, 14), (2, 3, 5), (6, 5, 7)]
+    ps, qs, rs = zip(*triples)
+    
+    batch = triple_coherence_batch(ps, qs, rs, n)
+    assert isinstance(batch, list)
+    assert len(batch) == len(triples)
+    
+    for (p, q, r), coh in zip(triples, batch):
+        assert coh == triple_coherence(p, q, r, n)
+    
+    # Empty batch
+    assert triple_coherence_batch([], [], [], n) == []
+    
+    print("✓ Batched triple coherence")
+
 def test_coherence_discrimination():
     """Test that coherence discriminates between factors and non-factors"""
     n = 143  # 11 × 13
@@ -162,6 +214,10 @@ def test_coherence_determinism():
     
     assert all(r == cache_results[0] for r in cache_results)
     
+    # Reusing a cached result gives exactly the uncached value
+    assert cache.get_coherence(99, 101, 9999) == coherence(99, 101, 9999)
+    assert cache.get_coherence(101, 99, 9999) is cache.get_coherence(99, 101, 9999)
+    
     print("✓ Coherence is deterministic")
 
 def test_coherence_patterns():
@@ -197,6 +253,7 @@ def run_all_tests():
     test_coherence_properties()
     test_coherence_cache()
     test_triple_coherence()
+    test_triple_coherence_batch()
     test_coherence_discrimination()
     test_coherence_edge_cases()
     test_coherence_determinism()
@@ -9,9 +9,11 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(
 
 from axiom3.fold_topology import (
     fold_energy,
+    fold_energy_batch,
     sharp_fold_candidates,
     FoldTopology,
-    find_energy_valleys
+    find_energy_valleys,
+    _fold_energies
 )
 
 def test_fold_energy():
@@ -39,8 +41,38 @@ def test_fold_energy():
     assert energy_7 < energy_8
     assert energy_11 < energy_8
     
+    # Beyond float precision the complement is still the exact n // x
+    from axiom3.spectral_core import spectral_vector, spectral_distance
+    from axiom3.spectral_signature_cache import SpectralSignatureCache
+    n = (2**89 - 1) * (2**61 - 1)
+    x = 12345
+    expected = spectral_distance(spectral_vector(x), spectral_vector(n // x), spectral_vector(n))
+    assert fold_energy(n, x) == expected
+    assert SpectralSignatureCache(cache_size=100).get_fold_energy(n, x) == expected
+    
     print("✓ Fold energy calculation")
 
+def test_fold_energy_sweep():
+    """Test that long energy sweeps match per-position fold energies"""
+    n = 10**9 + 7
+    energies = _fold_energies(n, 2, 2_102)
+    
+    assert len(energies) == 2_100
+    assert energies[:5] == [fold_energy(n, x) for x in range(2, 7)]
+    assert energies[-5:] == [fold_energy(n, x) for x in range(2_097, 2_102)]
+    assert _fold_energies(n, 5, 5) == []
+    
+    # The process pool is opt-in and must match the serial sweep
+    from axiom3.fold_topology import _PARALLEL_MIN_SPAN
+    stop = 2 + 2 * _PARALLEL_MIN_SPAN
+    assert _fold_energies(n, 2, stop, workers=2) == _fold_energies(n, 2, stop)
+    
+    # Batch form shares S(n) but matches the scalar function, edges included
+    positions = [0, 1, 3, 4, 5, 15, 16, -2]
+    assert fold_energy_batch(15, positions) == [fold_energy(15, x) for x in positions]
+    
+    print("✓ Fold energy sweeps are span-consistent")
+
 def test_sharp_fold_candidates():
     """Test sharp fold detection"""
     # Test with known factorization
@@ -99,6 +131,13 @@ def test_fold_topology_components():
         all_points.update(comp)
     assert all_points == set(topo.points)
     
+    # Components are disjoint and no connection crosses between them
+    label = {p: i for i, comp in enumerate(components) for p in comp}
+    assert len(label) == sum(len(comp) for comp in components)
+    for p1, neighbors in topo.connections.items():
+        for p2, _ in neighbors:
+            assert label[p1] == label[p2]
+    
     print("✓ Topology component detection")
 
 def test_fold_topology_traverse():
@@ -221,6 +260,7 @@ def run_all_tests():
     print("-" * 40)
     
     test_fold_energy()
+    test_fold_energy_sweep()
     test_sharp_fold_candidates()
     test_fold_topology_init()
     test_fold_topology_components()
@@ -11,10 +11,17 @@ import math
 from axiom3.interference import (
     prime_fib_interference,
     interference_extrema,
+    interference_extrema_from,
     identify_resonance_source,
     interference_gradient,
-    resonance_strength
+    resonance_strength,
+    _interference_span,
+    _interference_at,
+    _wave_frequencies,
+    _wave_sources
 )
+from axiom1 import primes_up_to
+from axiom2 import fib, PHI
 
 def test_prime_fib_interference():
     """Test interference pattern generation"""
@@ -36,6 +43,42 @@ def test_prime_fib_interference():
     
     print("✓ Interference pattern generation")
 
+def test_interference_large_span():
+    """Test that large spectra match the serial span computation"""
+    root = 50_050
+    n = root * root
+    spectrum = prime_fib_interference(n)
+    
+    assert len(spectrum) == root - 1
+    
+    # Spot-check both ends against the single-span kernel
+    prime_freqs, fib_freqs = _wave_frequencies(n, root)
+    assert len(prime_freqs) == len(fib_freqs) == 10
+    assert spectrum[:5] == _interference_span(prime_freqs, fib_freqs, 2, 7)
+    assert spectrum[-5:] == _interference_span(prime_freqs, fib_freqs, root - 4, root + 1)
+    
+    # The looped span kernel reproduces the single-position values exactly
+    assert spectrum[:200] == [_interference_at(x, prime_freqs, fib_freqs) for x in range(2, 202)]
+    
+    # The process pool is opt-in and concatenates spans in order
+    assert prime_fib_interference(n, workers=2) == spectrum
+    
+    print("✓ Large interference spectra are span-consistent")
+
+def test_wave_sources():
+    """Test precomputed wave source tables against fresh generation"""
+    for root in [1, 2, 5, 13, 30, 97, 100, 1000, 10000]:
+        primes, fibs = _wave_sources(root)
+        assert primes == primes_up_to(root)[:10]
+        expected = []
+        k = 2
+        while fib(k) <= root and len(expected) < 10:
+            expected.append(fib(k))
+            k += 1
+        assert fibs == expected
+    
+    print("✓ Wave source tables")
+
 def test_interference_extrema():
     """Test extrema detection in interference"""
     n = 143  # 11 × 13
@@ -55,22 +98,48 @@ def test_interference_extrema():
     
     print("✓ Interference extrema detection")
 
+def test_interference_extrema_from():
+    """Test extrema derived from a precomputed pattern"""
+    for n in [35, 143, 1001]:
+        spectrum = prime_fib_interference(n)
+        assert interference_extrema_from(spectrum) == interference_extrema(n)
+        assert interference_extrema_from(spectrum, top=5) == interference_extrema(n, top=5)
+    
+    # Too short to contain an extremum
+    assert interference_extrema_from([1.0, 2.0]) == []
+    
+    print("✓ Extrema from precomputed pattern")
+
 def test_identify_resonance_source():
     """Test resonance source identification"""
     n = 77  # 7 × 11
     
     # Test at factor position
-    prime, fib = identify_resonance_source(7, n)
-    assert isinstance(prime, int)
-    assert isinstance(fib, int)
-    assert prime >= 2
-    assert fib >= 1
+    prime1, fib1 = identify_resonance_source(7, n)
+    assert isinstance(prime1, int)
+    assert isinstance(fib1, int)
+    assert prime1 >= 2
+    assert fib1 >= 1
     
     # Test at non-factor position
     prime2, fib2 = identify_resonance_source(6, n)
     assert isinstance(prime2, int)
     assert isinstance(fib2, int)
     
+    # Matches a full scan of the prime × Fibonacci grid
+    for n, x in [(77, 6), (221, 10), (1001, 13), (10403, 50), (10403, 101)]:
+        root = math.isqrt(n)
+        primes = [p for p in primes_up_to(min(root, 100)) if x % p != 0] or [2]
+        fibs = [f for f in (fib(k) for k in range(2, 20)) if f <= root] or [2]
+        best, expected = 0, (primes[0], fibs[0])
+        for p in primes:
+            for f in fibs:
+                resonance = (abs(math.cos(2 * math.pi * p * x / n)) *
+                             abs(math.cos(2 * math.pi * f * x / (n * PHI))))
+                if resonance > best:
+                    best, expected = resonance, (p, f)
+        assert identify_resonance_source(x, n) == expected
+    
     print("✓ Resonance source identification")
 
 def test_interference_gradient():
@@ -208,7 +277,10 @@ def run_all_tests():
     print("-" * 40)
     
     test_prime_fib_interference()
+    test_interference_large_span()
+    test_wave_sources()
     test_interference_extrema()
+    test_interference_extrema_from()
     test_identify_resonance_source()
     test_interference_gradient()
     test_resonance_strength()
@@ -12,7 +12,9 @@ from axiom3.spectral_core import (
     modular_spectrum,
     digital_spectrum,
     harmonic_spectrum,
-    spectral_vector
+    spectral_vector,
+    spectral_distance,
+    spectral_self_distance
 )
 
 def test_binary_spectrum():
@@ -40,6 +42,20 @@ def test_binary_spectrum():
     
     print("✓ Binary spectrum analysis")
 
+def test_binary_autocorrelation():
+    """Test closed-form autocorrelation against the direct bit sequence sum"""
+    for n in list(range(2, 300)) + [2**61 - 1, 2**64 + 1, 10**30 + 7]:
+        sequence = [1 if b == '1' else -1 for b in bin(n)[2:]]
+        length = len(sequence)
+        mean = sum(sequence) / length
+        expected = sum((sequence[i] - mean) * (sequence[i + 1] - mean)
+                       for i in range(length - 1)) / (length - 1)
+        variance = sum((x - mean) ** 2 for x in sequence) / length
+        expected = expected / variance if variance > 0 else 0
+        assert abs(binary_spectrum(n)[1] - expected) < 1e-12
+    
+    print("✓ Binary autocorrelation closed form")
+
 def test_modular_spectrum():
     """Test modular spectrum analysis"""
     # Test with prime
@@ -85,6 +101,14 @@ def test_digital_spectrum():
     spec = digital_spectrum(0)
     assert spec == [0.0, 0.0]
     
+    # Closed-form digital root agrees with repeated digit summing
+    for n in list(range(1, 2000)) + [10**20, 10**20 - 1, 7**90]:
+        root = n
+        while root >= 10:
+            root = sum(int(d) for d in str(root))
+        digits = str(n)
+        assert digital_spectrum(n) == [sum(map(int, digits)) / (len(digits) * 9), root / 9]
+    
     print("✓ Digital spectrum analysis")
 
 def test_harmonic_spectrum():
@@ -130,6 +154,28 @@ def test_spectral_vector():
     
     print("✓ Combined spectral vector")
 
+def test_spectral_distance():
+    """Test the shared squared-distance kernel"""
+    assert spectral_distance([1.0, 2.0], [3.0, 4.0], [2.0, 3.0]) == 0.0
+    assert spectral_distance([1.0, 0.0], [0.0, 0.0], [0.0, 1.0]) == 5.0
+    
+    # Matches the explicit component sum on real spectra
+    sa, sb, sn = spectral_vector(7), spectral_vector(11), spectral_vector(77)
+    expected = sum((a + b - 2 * c) ** 2 for a, b, c in zip(sa, sb, sn))
+    assert abs(spectral_distance(sa, sb, sn) - expected) < 1e-12
+    
+    print("✓ Spectral distance kernel")
+
+def test_spectral_self_distance():
+    """Test the square-case kernel matches the general one exactly"""
+    assert spectral_self_distance([1.0, 2.0], [1.0, 3.0]) == 4.0
+    
+    for a, n in [(7, 77), (10, 99), (101, 10403), (12345, 2**61 - 1)]:
+        sa, sn = spectral_vector(a), spectral_vector(n)
+        assert spectral_self_distance(sa, sn) == spectral_distance(sa, sa, sn)
+    
+    print("✓ Spectral self-distance kernel")
+
 def test_spectral_properties():
     """Test mathematical properties of spectra"""
     # Test that factors have related spectra
@@ -175,6 +221,10 @@ def test_spectral_edge_cases():
     assert len(vec) == 27
     assert all(isinstance(v, (int, float)) for v in vec)
     
+    # Every feature is a float, including degenerate all-ones bit patterns
+    for n in [0, 1, 2, 3, 7, 31, 2**20 - 1, large_n]:
+        assert all(type(v) is float for v in spectral_vector(n))
+    
     # Powers of 2
     for k in range(1, 10):
         n = 2 ** k
@@ -195,10 +245,13 @@ def run_all_tests():
     print("-" * 40)
     
     test_binary_spectrum()
+    test_binary_autocorrelation()
     test_modular_spectrum()
     test_digital_spectrum()
     test_harmonic_spectrum()
     test_spectral_vector()
+    test_spectral_distance()
+    test_spectral_self_distance()
     test_spectral_properties()
     test_spectral_determinism()
     test_spectral_edge_cases()
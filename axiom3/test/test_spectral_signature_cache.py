@@ -8,7 +8,7 @@ import os
 import time
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-from axiom3.spectral_signature_cache import SpectralSignatureCache
+from axiom3.spectral_signature_cache import SpectralSignatureCache, SegmentedLRU
 from axiom3.spectral_core import spectral_vector
 from axiom3.coherence import coherence
 from axiom3.interference import prime_fib_interference, interference_extrema
@@ -48,6 +48,41 @@ def test_coherence_symmetry():
     
     print("✓ Coherence symmetry exploitation works")
 
+def test_coherence_batch():
+    """Test batched coherence over the factors of n"""
+    cache = SpectralSignatureCache()
+    n = 210
+    factors = [2, 3, 5, 6, 7, 10, 14, 15]
+    
+    batch = cache.get_coherence_batch(factors, n)
+    assert len(batch) == len(factors)
+    
+    # Matches the per-pair path exactly and populates the same entries
+    fresh = SpectralSignatureCache()
+    for x, value in zip(factors, batch):
+        assert value == fresh.get_coherence(x, n // x, n)
+        assert value == cache.get_coherence(n // x, x, n)
+    
+    assert cache.get_coherence_batch([], n) == []
+    
+    print("✓ Batched coherence matches per-pair coherence")
+
+def test_self_coherence():
+    """Test square-case coherence shares entries with get_coherence"""
+    cache = SpectralSignatureCache()
+    fresh = SpectralSignatureCache()
+    n = 10403
+    
+    for a in range(2, 40):
+        assert cache.get_self_coherence(a, n) == fresh.get_coherence(a, a, n)
+    
+    # Later general lookups hit the entries it stored
+    hits = cache.cache_hits
+    cache.get_coherence(17, 17, n)
+    assert cache.cache_hits == hits + 1
+    
+    print("✓ Self coherence matches get_coherence")
+
 def test_interference_pattern_caching():
     """Test interference pattern caching"""
     cache = SpectralSignatureCache()
@@ -66,6 +101,11 @@ def test_interference_pattern_caching():
     assert all(isinstance(pos, int) for pos in extrema1)
     assert all(2 <= pos <= 5 for pos in extrema1)  # sqrt(35) ≈ 5.9
     
+    # Extrema are derived from the cached pattern, matching a fresh scan
+    from axiom3.interference import interference_extrema
+    for n in [143, 1001]:
+        assert cache.get_interference_pattern(n)[1] == interference_extrema(n)
+    
     print("✓ Interference pattern caching works")
 
 def test_fold_energy_map():
@@ -89,6 +129,13 @@ def test_fold_energy_map():
     assert e3_cached == e3
     assert cache.cache_hits > initial_hits
     
+    # Overflowing 1000 positions keeps the 500 lowest energies
+    n = 10**7 + 19
+    energies = {x: cache.get_fold_energy(n, x) for x in range(2, 1003)}
+    assert len(cache.fold_map[n]) == 500
+    lowest = sorted(energies.items(), key=lambda kv: kv[1])[:500]
+    assert cache.fold_map[n] == dict(lowest)
+    
     print("✓ Fold energy map works correctly")
 
 def test_sharp_folds_identification():
@@ -112,6 +159,13 @@ def test_sharp_folds_identification():
     sqrt_35 = int(35**0.5)
     assert all(2 <= x <= sqrt_35 for x in sharp)
     
+    # The batched fold map fill matches per-position fold energies
+    n = 10403
+    cache.get_sharp_folds(n)
+    fresh = SpectralSignatureCache()
+    for x in range(2, 100):
+        assert cache.fold_map[n][x] == fresh.get_fold_energy(n, x)
+    
     print("✓ Sharp fold identification works")
 
 def test_priority_precomputation():
@@ -135,6 +189,14 @@ def test_priority_precomputation():
     assert 8 in cache.spectral_cache
     assert 16 in cache.spectral_cache
     
+    # Evicted priority vectors are restored without being recomputed
+    small = SpectralSignatureCache(cache_size=10)
+    for i in range(100, 150):
+        small.get_spectral_vector(i)
+    assert 2 not in small.spectral_cache
+    assert small.get_spectral_vector(2) == spectral_vector(2)
+    assert small.spectral_cache[2] is small.priority_spectra[2]
+    
     print("✓ Priority number pre-computation works")
 
 def test_lru_eviction():
@@ -156,6 +218,40 @@ def test_lru_eviction():
     
     print("✓ LRU eviction works correctly")
 
+def test_segmented_lru():
+    """Test that reused entries survive a scan of one-off entries"""
+    cache = SpectralSignatureCache(cache_size=10)
+    
+    # Touch 7 twice: the hit promotes it to the protected segment
+    cache.get_spectral_vector(7)
+    cache.get_spectral_vector(7)
+    
+    # Scan far more one-off entries than the cache holds
+    for i in range(100, 150):
+        cache.get_spectral_vector(i)
+    
+    assert len(cache.spectral_cache) <= 10
+    assert 7 in cache.spectral_cache
+    assert 149 in cache.spectral_cache
+    
+    # Protected overflow demotes the coldest entry back to probation
+    lru = SegmentedLRU(protected_size=2)
+    for key in 'abc':
+        lru[key] = key
+        lru.move_to_end(key)
+    assert list(lru.protected) == ['b', 'c']
+    assert list(lru.probation) == ['a']
+    assert lru.popitem(last=False) == ('a', 'a')
+    assert dict(lru) == {'b': 'b', 'c': 'c'}
+    
+    # get peeks without promoting
+    lru['d'] = 'd'
+    assert lru.get('d') == 'd'
+    assert lru.get('z') is None and lru.get('z', 0) == 0
+    assert list(lru.probation) == ['d']
+    
+    print("✓ Segmented LRU keeps reused entries")
+
 def test_exact_computation():
     """Verify exact computation (no approximation)"""
     cache = SpectralSignatureCache()
@@ -169,6 +265,10 @@ def test_exact_computation():
     # Should be exactly equal
     assert s_cached == s_direct
     
+    # Callers get their own copy; the cached vector cannot be corrupted
+    s_cached[0] = -1.0
+    assert cache.get_spectral_vector(123) == s_direct
+    
     # Test coherence computation
     c_cached = cache.get_coherence(3, 41, 123)
     
@@ -184,8 +284,31 @@ def test_exact_computation():
     
     assert abs(c_cached - c_direct) < 1e-10
     
+    # Double-array storage is lossless: cached results are bit-identical
+    for a, b, n in [(3, 41, 123), (7, 11, 77), (13, 17, 221), (10, 10, 100)]:
+        assert cache.get_coherence(a, b, n) == coherence(a, b, n)
+        assert cache.get_fold_energy(n, a) == fold_energy(n, a)
+    
     print("✓ Exact computation verified (no approximation)")
 
+def test_compact_storage():
+    """Test float32 spectral storage stays within single precision"""
+    cache = SpectralSignatureCache(compact=True)
+    exact = SpectralSignatureCache()
+    
+    assert cache.spectral_cache[2].itemsize == 4
+    assert exact.spectral_cache[2].itemsize == 8
+    
+    s_compact = cache.get_spectral_vector(123)
+    s_direct = spectral_vector(123)
+    assert len(s_compact) == len(s_direct)
+    assert all(abs(a - b) < 1e-6 for a, b in zip(s_compact, s_direct))
+    
+    assert abs(cache.get_coherence(7, 11, 77) - exact.get_coherence(7, 11, 77)) < 1e-5
+    assert abs(cache.get_fold_energy(77, 7) - exact.get_fold_energy(77, 7)) < 1e-5
+    
+    print("✓ Compact float32 storage")
+
 def test_precompute_for_n():
     """Test minimal pre-computation for specific n"""
     cache = SpectralSignatureCache()
@@ -287,12 +410,16 @@ def run_all_tests():
     
     test_spectral_vector_caching()
     test_coherence_symmetry()
+    test_coherence_batch()
+    test_self_coherence()
     test_interference_pattern_caching()
     test_fold_energy_map()
     test_sharp_folds_identification()
     test_priority_precomputation()
     test_lru_eviction()
+    test_segmented_lru()
     test_exact_computation()
+    test_compact_storage()
     test_precompute_for_n()
     test_performance_improvement()
     test_create_optimized()
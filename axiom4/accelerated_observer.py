@@ -3,7 +3,13 @@ Accelerated Observer - High-level functions using ObserverCache
 Provides accelerated observation, navigation, and quantum collapse
 """
 
+import heapq
 import math
+import time
+from collections import deque
+from functools import partial
+from itertools import chain
+from operator import itemgetter
 from typing import List, Dict, Tuple, Optional, Any
 from .observer_cache import ObserverCache
 from .adaptive_observer import (
@@ -16,7 +22,8 @@ from .spectral_navigation import (
     coherence_gradient as direct_gradient,
     gradient_ascent as direct_ascent,
     multi_path_search as direct_multi_path,
-    navigate_to_factor as direct_navigate
+    navigate_to_factor as direct_navigate,
+    harmonic_jump
 )
 from .quantum_tools import (
     quantum_superposition_collapse as direct_quantum_collapse
@@ -82,7 +89,8 @@ def accelerated_gradient(n: int, position: int, observer: MultiScaleObserver,
 def accelerated_collapse(n: int, candidates: List[int], 
                         observer: MultiScaleObserver,
                         iterations: int = 5,
-                        cache: Optional[ObserverCache] = None) -> List[Tuple[int, float]]:
+                        cache: Optional[ObserverCache] = None,
+                        stop_on_factor: bool = False) -> List[Tuple[int, float]]:
     """
     Optimized wavefunction collapse with caching
     
@@ -92,14 +100,23 @@ def accelerated_collapse(n: int, candidates: List[int],
         observer: Multi-scale observer
         iterations: Number of collapse iterations
         cache: Optional cache instance
+        stop_on_factor: Return [(factor, weight)] as soon as a candidate
+            divides n, instead of completing the collapse
         
     Returns:
         List of (position, weight) tuples sorted by weight
     """
     if cache is None:
         cache = get_global_cache()
+    
+    # Trial division is far cheaper than observation
+    if stop_on_factor:
+        for x in candidates:
+            if x > 1 and n % x == 0:
+                return [(x, cache.get_observation(observer, x))]
         
-    root = int(math.isqrt(n))
+    root = cache.get_root(n)
+    steps = cache.get_step_schedule(n, iterations)
     
     # Check if we have a cached state we can resume from
     for i in range(iterations - 1, -1, -1):
@@ -114,51 +131,53 @@ def accelerated_collapse(n: int, candidates: List[int],
         weighted_candidates = [(x, cache.get_observation(observer, x)) for x in candidates]
         start_iteration = 0
     
+    get_gradient = cache.get_gradient
+    get_observation = cache.get_observation
+    
     for iteration in range(start_iteration, iterations):
         new_candidates = []
+        step_size = steps[iteration]
         
         for x, weight in weighted_candidates:
             # Calculate gradient using cache
-            gradient = cache.get_gradient(n, x, observer)
+            gradient = get_gradient(n, x, observer)
             
             # Move in gradient direction
-            step_size = max(1, int(root * 0.02 / (iteration + 1)))
             if gradient > 0:
-                new_x = min(root, x + step_size)
+                new_x = x + step_size if x + step_size < root else root
             elif gradient < 0:
-                new_x = max(2, x - step_size)
+                new_x = x - step_size if x - step_size > 2 else 2
             else:
                 new_x = x
             
             # Calculate new weight using cached observation
-            new_coherence = cache.get_observation(observer, new_x)
+            new_coherence = get_observation(observer, new_x)
             new_weight = new_coherence * (1 + abs(gradient))
             
+            if stop_on_factor and new_x > 1 and n % new_x == 0:
+                return [(new_x, new_weight)]
+            
             new_candidates.append((new_x, new_weight))
         
-        # Keep top candidates
-        new_candidates.sort(key=lambda t: -t[1])
-        weighted_candidates = new_candidates[:max(20, len(candidates) // 2)]
+        # Keep top candidates (stable, like a full descending sort)
+        weighted_candidates = heapq.nlargest(max(20, len(candidates) // 2),
+                                             new_candidates, key=itemgetter(1))
         
         # Add exploration positions
         if iteration < iterations - 1:
-            gradient_positions = []
-            for x, _ in weighted_candidates[:10]:
-                for offset in [-1, 1]:
-                    test_x = x + offset * step_size
-                    if 2 <= test_x <= root:
-                        coh = cache.get_observation(observer, test_x)
-                        gradient_positions.append((test_x, coh))
+            test_positions = [x for c, _ in weighted_candidates[:10]
+                              for x in (c - step_size, c + step_size)
+                              if 2 <= x <= root]
+            gradient_positions = list(zip(
+                test_positions, cache.get_observations_batch(observer, test_positions)))
             
-            # Merge with existing candidates
-            all_positions = weighted_candidates + gradient_positions
+            # Merge with existing candidates, keeping the first entry per
+            # position (set.add returns None, so the filter stays truthy)
             seen = set()
-            unique = []
-            for x, w in all_positions:
-                if x not in seen:
-                    seen.add(x)
-                    unique.append((x, w))
-            weighted_candidates = sorted(unique, key=lambda t: -t[1])[:len(candidates)]
+            unique = [t for t in chain(weighted_candidates, gradient_positions)
+                      if t[0] not in seen and not seen.add(t[0])]
+            weighted_candidates = heapq.nlargest(len(candidates), unique,
+                                                 key=itemgetter(1))
         
         # Cache the quantum state
         cache.cache_quantum_state(n, iteration, weighted_candidates)
@@ -185,19 +204,20 @@ def accelerated_navigation(n: int, start: int, observer: MultiScaleObserver,
         cache = get_global_cache()
         
     # Check if we have a cached path that might help
-    root = int(math.isqrt(n))
-    for end in range(2, min(root + 1, 100)):
-        if n % end == 0:
-            path = cache.get_navigation_path(n, start, end)
-            if path:
-                # Follow cached path
-                for pos in path:
-                    if n % pos == 0 and pos > 1:
-                        return pos
+    root = cache.get_root(n)
+    steps = cache.get_step_schedule(n, max_iterations)
+    for end in cache.get_small_divisors(n):
+        path = cache.get_navigation_path(n, start, end)
+        if path:
+            # Follow cached path
+            for pos in path:
+                if n % pos == 0 and pos > 1:
+                    return pos
     
     # No cached path, navigate with caching
     current = start
     path = [current]
+    append_path = path.append
     stuck_count = 0
     visited = set()
     
@@ -214,30 +234,28 @@ def accelerated_navigation(n: int, start: int, observer: MultiScaleObserver,
         gradient = cache.get_gradient(n, current, observer)
         
         # Determine step size
-        step_size = max(1, int(root * 0.02 / (iteration + 1)))
+        step_size = steps[iteration]
         
         # Move in gradient direction
         if abs(gradient) < 1e-6:
             # No gradient, need to jump
             stuck_count += 1
             # Use harmonic jump
-            from .spectral_navigation import harmonic_jump
             new_pos = harmonic_jump(n, current, stuck_count)
         else:
             if gradient > 0:
-                new_pos = min(root, current + step_size)
+                new_pos = current + step_size if current + step_size < root else root
             else:
-                new_pos = max(2, current - step_size)
+                new_pos = current - step_size if current - step_size > 2 else 2
                 
             if new_pos == current or new_pos in visited:
                 stuck_count += 1
-                from .spectral_navigation import harmonic_jump
                 new_pos = harmonic_jump(n, current, stuck_count)
             else:
                 stuck_count = 0
         
         current = new_pos
-        path.append(current)
+        append_path(current)
     
     return None
 
@@ -263,11 +281,7 @@ def accelerated_coherence_field(n: int, positions: List[int],
     if len(positions) > 10:
         cache.precompute_critical_positions(n, observer)
     
-    field = {}
-    for pos in positions:
-        field[pos] = cache.get_observation(observer, pos)
-    
-    return field
+    return dict(zip(positions, cache.get_observations_batch(observer, positions)))
 
 def accelerated_gradient_ascent(n: int, start: int, observer: MultiScaleObserver,
                                max_steps: int = 50, tolerance: float = 1e-6,
@@ -289,7 +303,8 @@ def accelerated_gradient_ascent(n: int, start: int, observer: MultiScaleObserver
     if cache is None:
         cache = get_global_cache()
         
-    root = int(math.isqrt(n))
+    root = cache.get_root(n)
+    steps = cache.get_step_schedule(n, max_steps)
     path = [start]
     current = start
     
@@ -302,13 +317,13 @@ def accelerated_gradient_ascent(n: int, start: int, observer: MultiScaleObserver
             break
         
         # Adaptive step size
-        step_size = max(1, int(root * 0.02 / (step + 1)))
+        step_size = steps[step]
         
         # Move in gradient direction
         if grad > 0:
-            next_pos = min(root, current + step_size)
+            next_pos = current + step_size if current + step_size < root else root
         elif grad < 0:
-            next_pos = max(2, current - step_size)
+            next_pos = current - step_size if current - step_size > 2 else 2
         else:
             break
         
@@ -345,29 +360,27 @@ def accelerated_multi_path(n: int, starts: List[int], observer: MultiScaleObserv
         cache = get_global_cache()
         
     endpoints = []
-    paths_to_explore = starts[:max_paths]
+    seen = set()
+    
+    # Ascent is deterministic, so a repeated start would retrace the same
+    # path to the same endpoint; explore each distinct start once, in order
+    paths_to_explore = dict.fromkeys(starts[:max_paths])
     
     for start in paths_to_explore:
         # Follow gradient with caching
         path = accelerated_gradient_ascent(n, start, observer, cache=cache)
         
-        if path:
+        # Paths often converge; a repeated endpoint has the same coherence,
+        # so only its first occurrence is kept (and observed)
+        if path and path[-1] not in seen:
             endpoint = path[-1]
-            coh = cache.get_observation(observer, endpoint)
-            endpoints.append((endpoint, coh))
-    
-    # Sort by coherence
-    endpoints.sort(key=lambda t: -t[1])
+            seen.add(endpoint)
+            endpoints.append((endpoint, cache.get_observation(observer, endpoint)))
     
-    # Remove duplicates
-    seen = set()
-    unique_endpoints = []
-    for pos, coh in endpoints:
-        if pos not in seen:
-            seen.add(pos)
-            unique_endpoints.append((pos, coh))
+    # Sort by coherence (stable, so ties keep exploration order)
+    endpoints.sort(key=lambda t: t[1], reverse=True)
     
-    return unique_endpoints
+    return endpoints
 
 def create_accelerated_observer(n: int) -> Tuple[MultiScaleObserver, ObserverCache]:
     """
@@ -390,6 +403,27 @@ def create_accelerated_observer(n: int) -> Tuple[MultiScaleObserver, ObserverCac
     
     return observer, cache
 
+def _time_sweeps(func: Any, positions: List[int], sweeps: int) -> float:
+    """
+    Time repeated sweeps of func over positions
+    
+    The calls are driven by map() and drained by a zero-length deque, so
+    no Python-level loop body is timed alongside func.
+    
+    Args:
+        func: Single-argument callable taking a position
+        positions: Positions to evaluate in each sweep
+        sweeps: Number of sweeps
+        
+    Returns:
+        Elapsed seconds
+    """
+    drain = deque(maxlen=0).extend
+    start = time.perf_counter()
+    for _ in range(sweeps):
+        drain(map(func, positions))
+    return time.perf_counter() - start
+
 def benchmark_acceleration(n: int, iterations: int = 100) -> Dict[str, float]:
     """
     Benchmark acceleration vs direct computation
@@ -401,42 +435,26 @@ def benchmark_acceleration(n: int, iterations: int = 100) -> Dict[str, float]:
     Returns:
         Dictionary with timing results
     """
-    import time
-    
     observer = MultiScaleObserver(n)
     cache = ObserverCache.create_optimized(n)
     
     # Test observation
     test_positions = list(range(2, min(20, int(math.isqrt(n)))))
     
-    # Direct observation
-    start = time.time()
-    for _ in range(iterations):
-        for pos in test_positions:
-            _ = observer.observe(pos)
-    time_direct_observe = time.time() - start
+    # Direct vs cached observation
+    time_direct_observe = _time_sweeps(observer.observe, test_positions, iterations)
     
-    # Cached observation
     cache.clear()
-    start = time.time()
-    for _ in range(iterations):
-        for pos in test_positions:
-            _ = cache.get_observation(observer, pos)
-    time_cached_observe = time.time() - start
+    time_cached_observe = _time_sweeps(partial(cache.get_observation, observer),
+                                       test_positions, iterations)
     
     # Test gradient computation
-    start = time.time()
-    for _ in range(iterations // 10):
-        for pos in test_positions:
-            _ = direct_gradient(n, pos, observer)
-    time_direct_gradient = time.time() - start
+    time_direct_gradient = _time_sweeps(partial(direct_gradient, n, observer=observer),
+                                        test_positions, iterations // 10)
     
     cache.clear()
-    start = time.time()
-    for _ in range(iterations // 10):
-        for pos in test_positions:
-            _ = cache.get_gradient(n, pos, observer)
-    time_cached_gradient = time.time() - start
+    time_cached_gradient = _time_sweeps(partial(cache.get_gradient, n, observer=observer),
+                                        test_positions, iterations // 10)
     
     # Calculate speedups
     speedup_observe = time_direct_observe / time_cached_observe if time_cached_observe > 0 else float('inf')
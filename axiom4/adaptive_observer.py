@@ -3,8 +3,11 @@ Adaptive Observer - Multi-scale observation with quantum superposition
 Implements observer effect through coherence-driven measurement
 """
 
+import heapq
 import math
-from typing import List, Dict, Tuple, Set
+from itertools import chain
+from operator import itemgetter
+from typing import List, Dict, Tuple, Set, Optional, Callable
 
 # Import dependencies from other axioms
 import sys
@@ -12,7 +15,8 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from axiom1 import primes_up_to
 from axiom2 import fib, PHI, GOLDEN_ANGLE
-from axiom3 import coherence, accelerated_coherence
+from axiom3 import coherence
+from axiom3.accelerated_analysis import get_global_cache as get_coherence_cache
 
 class MultiScaleObserver:
     """
@@ -38,13 +42,22 @@ class MultiScaleObserver:
             "Ω": max(1, fib(max(1, int(math.log2(self.root)))))  # Omega scale
         }
         
-    def coherence_at_scale(self, x: int, scale: int) -> float:
+        # Scale weights by inverse log of scale, computed once
+        self.scale_weights = [
+            (scale_value, 1 / (1 + math.log(max(1, scale_value))))
+            for scale_value in self.scales.values()
+        ]
+        
+    def coherence_at_scale(self, x: int, scale: int,
+                           samples: Optional[Dict[int, float]] = None) -> float:
         """
         Calculate coherence at position x using given scale
         
         Args:
             x: Position to observe
             scale: Observation scale
+            samples: Optional memo of coherence by position, shared across
+                scales so overlapping windows sample each position once
             
         Returns:
             Average coherence in scale window
@@ -55,41 +68,64 @@ class MultiScaleObserver:
         # Window size based on scale
         window = max(1, scale // 5)
         coherence_sum = 0.0
-        count = 0
         
-        # Sample coherence in window around x
-        for offset in range(-scale, scale + 1, window):
-            pos = x + offset
-            if 2 <= pos <= self.root:
-                # Check if pos divides n
-                if self.n % pos == 0:
-                    coh = accelerated_coherence(pos, self.n // pos, self.n)
+        if samples is None:
+            samples = {}
+        n = self.n
+        
+        # Resolve the shared coherence cache once per window rather than
+        # once per sampled position
+        coherence_cache = get_coherence_cache()
+        get_coherence = coherence_cache.get_coherence
+        get_self_coherence = coherence_cache.get_self_coherence
+        
+        # Sample coherence in window around x, clipped to [2, root]
+        positions = range(max(x - scale, 2 + (x - scale - 2) % window),
+                          min(x + scale, self.root) + 1, window)
+        get_sample = samples.get
+        for pos in positions:
+            coh = get_sample(pos)
+            if coh is None:
+                # Check if pos divides n. Almost no positions do, so a bare
+                # % beats divmod(): the quotient is only needed on a hit
+                if n % pos == 0:
+                    coh = get_coherence(pos, n // pos, n)
                 else:
                     # Use pos as potential factor
-                    coh = accelerated_coherence(pos, pos, self.n)
-                coherence_sum += coh
-                count += 1
+                    coh = get_self_coherence(pos, n)
+                samples[pos] = coh
+            coherence_sum += coh
         
+        count = len(positions)
         return coherence_sum / count if count > 0 else 0.0
     
-    def observe(self, x: int) -> float:
+    def observe(self, x: int, samples: Optional[Dict[int, float]] = None) -> float:
         """
         Perform multi-scale observation at position x
         
         Args:
             x: Position to observe
+            samples: Optional memo of coherence by position, for sharing
+                samples between observations of nearby positions
             
         Returns:
             Weighted coherence across all scales
         """
+        # Outside [2, root] every scale window is empty
+        if x < 2 or x > self.root:
+            return 0.0
+        
         total_coherence = 0.0
         
-        for scale_name, scale_value in self.scales.items():
+        # Scale windows overlap: each position's coherence is sampled once
+        # and shared across scales
+        if samples is None:
+            samples = {}
+        coherence_at_scale = self.coherence_at_scale
+        
+        for scale_value, weight in self.scale_weights:
             # Calculate coherence at this scale
-            scale_coherence = self.coherence_at_scale(x, scale_value)
-            
-            # Weight by inverse log of scale
-            weight = 1 / (1 + math.log(max(1, scale_value)))
+            scale_coherence = coherence_at_scale(x, scale_value, samples)
             total_coherence += weight * scale_coherence
         
         return total_coherence
@@ -104,9 +140,13 @@ class MultiScaleObserver:
         Returns:
             Dictionary mapping position to coherence
         """
+        # Windows of nearby positions overlap, so samples are shared
+        # across the whole field
+        samples: Dict[int, float] = {}
         field = {}
+        observe = self.observe
         for pos in positions:
-            field[pos] = self.observe(pos)
+            field[pos] = observe(pos, samples)
         return field
 
 def generate_superposition(n: int, hints: List[int] = None) -> List[int]:
@@ -133,26 +173,17 @@ def generate_superposition(n: int, hints: List[int] = None) -> List[int]:
     if hints:
         superposition.update(h for h in hints if 2 <= h <= root)
     
-    # Add Fibonacci positions
-    k = 1
-    while True:
-        f = fib(k)
-        if f > root:
-            break
+    # Add Fibonacci positions, stepping F(k), F(k+1) forward from F(1)
+    # rather than recomputing each F(k) from scratch
+    f, f_next = 1, 1
+    while f <= root:
         if f >= 2:
             superposition.add(f)
             # Also add golden ratio scaled positions
             golden_pos = int(f * PHI)
             if 2 <= golden_pos <= root:
                 superposition.add(golden_pos)
-        k += 1
-    
-    # Add sqrt neighborhood
-    sqrt_range = max(10, int(root * 0.1))
-    for offset in range(-sqrt_range, sqrt_range + 1):
-        pos = root + offset
-        if 2 <= pos <= root:
-            superposition.add(pos)
+        f, f_next = f_next, f + f_next
     
     # Add golden spiral positions
     angle = 0
@@ -163,11 +194,41 @@ def generate_superposition(n: int, hints: List[int] = None) -> List[int]:
             superposition.add(x_pos)
         angle += GOLDEN_ANGLE
     
-    return sorted(list(superposition))
+    # Add sqrt neighborhood; positions above root are never candidates,
+    # so only the lower half of root ± sqrt_range applies. It is one
+    # contiguous, already sorted block at the top of the range, so only
+    # the sparse positions below it need hashing and sorting
+    sqrt_range = max(10, int(root * 0.1))
+    low = max(2, root - sqrt_range)
+    below = sorted(x for x in superposition if x < low)
+    return below + list(range(low, root + 1))
+
+def _memoized_observe(observer: MultiScaleObserver) -> Callable[[int], float]:
+    """
+    Wrap observer.observe so each position is observed at most once
+    
+    Observation is deterministic in x, so a memo scoped to a single
+    computation returns exactly what repeated calls would. Coherence
+    samples are shared across the whole computation too, as in
+    coherence_field, so nearby positions reuse each other's windows.
+    """
+    observations: Dict[int, float] = {}
+    samples: Dict[int, float] = {}
+    get_observation = observations.get
+    observe_uncached = observer.observe
+    
+    def observe(x: int) -> float:
+        value = get_observation(x)
+        if value is None:
+            value = observations[x] = observe_uncached(x, samples)
+        return value
+    
+    return observe
 
 def collapse_wavefunction(n: int, candidates: List[int], 
                          observer: MultiScaleObserver, 
-                         iterations: int = 5) -> List[Tuple[int, float]]:
+                         iterations: int = 5,
+                         stop_on_factor: bool = False) -> List[Tuple[int, float]]:
     """
     Collapse quantum superposition through iterative observation
     
@@ -178,55 +239,74 @@ def collapse_wavefunction(n: int, candidates: List[int],
         candidates: Initial superposition
         observer: Multi-scale observer
         iterations: Number of collapse iterations
+        stop_on_factor: Return [(factor, weight)] as soon as a candidate
+            divides n, instead of completing the collapse
         
     Returns:
         List of (position, weight) tuples sorted by weight
     """
     root = int(math.isqrt(n))
     
+    # Candidates revisit the same positions across iterations
+    observe = _memoized_observe(observer)
+    
+    # Trial division is far cheaper than observation
+    if stop_on_factor:
+        for x in candidates:
+            if x > 1 and n % x == 0:
+                return [(x, observe(x))]
+    
     # Initialize weights
-    weighted_candidates = [(x, observer.observe(x)) for x in candidates]
+    weighted_candidates = [(x, observe(x)) for x in candidates]
+    
+    # Candidates kept after each step and after each exploration merge
+    keep_top = max(20, len(candidates) // 2)
+    keep_merged = len(candidates)
+    
+    # Gradient delta is fixed for the whole collapse
+    delta = max(1, int(root * 0.01))
     
     for iteration in range(iterations):
         new_candidates = []
+        step_size = max(1, int(root * 0.02 / (iteration + 1)))
         
         for x, weight in weighted_candidates:
             # Calculate coherence gradient
-            delta = max(1, int(root * 0.01))
-            
             # Forward difference
             if x + delta <= root:
-                coh_plus = observer.observe(x + delta)
+                coh_plus = observe(x + delta)
             else:
                 coh_plus = weight
             
             # Backward difference
             if x - delta >= 2:
-                coh_minus = observer.observe(x - delta)
+                coh_minus = observe(x - delta)
             else:
                 coh_minus = weight
             
             # Gradient
             gradient = (coh_plus - coh_minus) / (2 * delta)
             
-            # Move in gradient direction
-            step_size = max(1, int(root * 0.02 / (iteration + 1)))
+            # Move in gradient direction, clamped without min()/max() calls
             if gradient > 0:
-                new_x = min(root, x + step_size)
+                new_x = x + step_size if x + step_size < root else root
             elif gradient < 0:
-                new_x = max(2, x - step_size)
+                new_x = x - step_size if x - step_size > 2 else 2
             else:
                 new_x = x
             
             # Calculate new weight
-            new_coherence = observer.observe(new_x)
+            new_coherence = observe(new_x)
             new_weight = new_coherence * (1 + abs(gradient))
             
+            if stop_on_factor and new_x > 1 and n % new_x == 0:
+                return [(new_x, new_weight)]
+            
             new_candidates.append((new_x, new_weight))
         
-        # Keep top candidates
-        new_candidates.sort(key=lambda t: -t[1])
-        weighted_candidates = new_candidates[:max(20, len(candidates) // 2)]
+        # Keep top candidates (stable, like a full descending sort)
+        weighted_candidates = heapq.nlargest(keep_top, new_candidates,
+                                             key=itemgetter(1))
         
         # Add some exploration
         if iteration < iterations - 1:
@@ -236,18 +316,16 @@ def collapse_wavefunction(n: int, candidates: List[int],
                 for offset in [-1, 1]:
                     test_x = x + offset * step_size
                     if 2 <= test_x <= root:
-                        gradient_positions.append((test_x, observer.observe(test_x)))
+                        gradient_positions.append((test_x, observe(test_x)))
             
-            # Merge with existing candidates
-            all_positions = weighted_candidates + gradient_positions
-            # Remove duplicates
-            seen = set()
-            unique = []
-            for x, w in all_positions:
-                if x not in seen:
-                    seen.add(x)
-                    unique.append((x, w))
-            weighted_candidates = sorted(unique, key=lambda t: -t[1])[:len(candidates)]
+            # Merge with existing candidates, keeping the best weight found
+            # for each position (ties keep the earlier entry)
+            merged: Dict[int, float] = {}
+            for x, w in chain(weighted_candidates, gradient_positions):
+                if w > merged.get(x, -math.inf):
+                    merged[x] = w
+            weighted_candidates = heapq.nlargest(keep_merged, merged.items(),
+                                                 key=itemgetter(1))
     
     return weighted_candidates
 
@@ -266,25 +344,26 @@ def create_coherence_gradient_field(n: int, observer: MultiScaleObserver,
         Dictionary mapping position to gradient
     """
     root = int(math.isqrt(n))
-    field = {}
+    lo = max(2, center - radius)
+    hi = min(root, center + radius)
+    if lo > hi:
+        return {}
     
-    for offset in range(-radius, radius + 1):
-        x = center + offset
-        if 2 <= x <= root:
-            # Calculate gradient
-            delta = 1
-            
-            if x + delta <= root:
-                coh_plus = observer.observe(x + delta)
-            else:
-                coh_plus = observer.observe(x)
-                
-            if x - delta >= 2:
-                coh_minus = observer.observe(x - delta)
-            else:
-                coh_minus = observer.observe(x)
-            
-            gradient = (coh_plus - coh_minus) / (2 * delta)
-            field[x] = gradient
+    # Observe the span once, one position beyond each end, sharing
+    # coherence samples across the whole span
+    span = observer.coherence_field(
+        list(range(max(2, lo - 1), min(root, hi + 1) + 1)))
+    
+    # At the boundaries the missing neighbour falls back to x itself
+    obs = list(span.values())
+    if lo - 1 < 2:
+        obs.insert(0, obs[0])
+    if hi + 1 > root:
+        obs.append(obs[-1])
+    
+    # Central difference with delta = 1
+    field = {}
+    for i, x in enumerate(range(lo, hi + 1)):
+        field[x] = (obs[i + 2] - obs[i]) / 2
     
     return field
@@ -4,7 +4,6 @@ Ensures all modules benefit from the Observer Cache
 """
 
 from typing import List, Tuple, Optional, Dict
-import math
 
 # Import core modules
 from .adaptive_observer import MultiScaleObserver, generate_superposition
@@ -50,6 +49,7 @@ class IntegratedObserver:
         """
         self.n = n
         self.observer, self.cache = create_accelerated_observer(n)
+        self.root = self.observer.root
         
     def observe(self, x: int) -> float:
         """Observe with caching"""
@@ -64,10 +64,11 @@ class IntegratedObserver:
         return accelerated_coherence_field(self.n, positions, self.observer, self.cache)
         
     def collapse_wavefunction(self, candidates: List[int], 
-                            iterations: int = 5) -> List[Tuple[int, float]]:
+                            iterations: int = 5,
+                            stop_on_factor: bool = False) -> List[Tuple[int, float]]:
         """Collapse wavefunction with caching"""
         return accelerated_collapse(self.n, candidates, self.observer, 
-                                  iterations, self.cache)
+                                  iterations, self.cache, stop_on_factor)
         
     def navigate_to_factor(self, start: int, 
                           max_iterations: int = 100) -> Optional[int]:
@@ -92,6 +93,25 @@ class IntegratedObserver:
         return self.cache.get_cache_statistics()
 
 
+def _stratified_positions(root: int, strata: int) -> List[int]:
+    """
+    Distinct positions root * i / strata for i = 1..strata - 1 in [2, root]
+    
+    Args:
+        root: Integer square root of the number being factored
+        strata: Number of strata the range is divided into
+        
+    Returns:
+        Positions in increasing order, without repeats
+    """
+    positions = {}
+    for i in range(1, strata):
+        pos = int(root * i / strata)
+        if 2 <= pos <= root:
+            positions[pos] = None
+    return list(positions)
+
+
 def integrated_observer_search(n: int, memory: Optional[ResonanceMemory] = None,
                              max_iterations: int = 100) -> Optional[int]:
     """
@@ -117,12 +137,12 @@ def integrated_observer_search(n: int, memory: Optional[ResonanceMemory] = None,
     
     candidates = generate_superposition(n, hints)
     
-    # Collapse wavefunction
-    collapsed = observer.collapse_wavefunction(candidates[:50])
+    # Collapse wavefunction, stopping early at a dividing candidate
+    collapsed = observer.collapse_wavefunction(candidates[:50], stop_on_factor=True)
     
     # Try top candidates
     for pos, weight in collapsed[:10]:
-        if n % pos == 0 and pos > 1:
+        if pos > 1 and n % pos == 0:
             return pos
     
     # Navigate from top positions
@@ -144,14 +164,14 @@ def integrated_observer_search(n: int, memory: Optional[ResonanceMemory] = None,
     for pos, _ in collapsed[:3]:
         harmonics = harmonic_amplify(n, pos)
         for h_pos in harmonics[:5]:
-            if n % h_pos == 0 and h_pos > 1:
+            if h_pos > 1 and n % h_pos == 0:
                 return h_pos
     
     # Try spectral folding
     folder = SpectralFolder(n)
     for pos, _ in collapsed[:5]:
         fold = folder.nearest_fold(pos)
-        if n % fold == 0 and fold > 1:
+        if fold > 1 and n % fold == 0:
             return fold
         
         # Navigate from fold
@@ -187,19 +207,15 @@ def integrated_axiom4_factor(n: int, use_memory: bool = True,
         print("Phase 1: Initial exploration...")
     
     # Find coherence peaks
-    root = int(math.isqrt(n))
-    peak_positions = []
-    for i in range(10):
-        pos = int(root * (i + 1) / 11)
-        if 2 <= pos <= root:
-            peak_positions.append(pos)
+    root = observer.root
+    peak_positions = _stratified_positions(root, 11)
     
     # Multi-path search from peaks
     endpoints = observer.multi_path_search(peak_positions)
     
     # Check endpoints
     for pos, coh in endpoints:
-        if n % pos == 0 and pos > 1:
+        if pos > 1 and n % pos == 0:
             if verbose:
                 print(f"Found factor at coherence peak: {pos}")
             return pos
@@ -210,11 +226,11 @@ def integrated_axiom4_factor(n: int, use_memory: bool = True,
     
     # Generate and collapse superposition
     candidates = generate_superposition(n)
-    collapsed = observer.collapse_wavefunction(candidates)
+    collapsed = observer.collapse_wavefunction(candidates, stop_on_factor=True)
     
     # Try collapsed positions
     for pos, weight in collapsed[:20]:
-        if n % pos == 0 and pos > 1:
+        if pos > 1 and n % pos == 0:
             if verbose:
                 print(f"Found factor in collapsed state: {pos}")
             if memory:
@@ -238,15 +254,14 @@ def integrated_axiom4_factor(n: int, use_memory: bool = True,
     if verbose:
         print("Phase 4: Exhaustive navigation...")
         
-    # Try more starting positions
-    for i in range(20):
-        start = int(root * (i + 1) / 21)
-        if 2 <= start <= root:
-            factor = observer.navigate_to_factor(start, max_iterations=50)
-            if factor:
-                if verbose:
-                    print(f"Found factor through navigation: {factor}")
-                return factor
+    # Try more starting positions; navigation is deterministic, so a
+    # start repeated on a small root would only retrace a failed path
+    for start in _stratified_positions(root, 21):
+        factor = observer.navigate_to_factor(start, max_iterations=50)
+        if factor:
+            if verbose:
+                print(f"Found factor through navigation: {factor}")
+            return factor
     
     if verbose:
         print("No factor found")
@@ -5,15 +5,15 @@ Caches observation results, gradients, quantum states, and navigation paths
 
 import math
 from typing import Dict, List, Tuple, Optional, Any
-from collections import OrderedDict
+from collections.abc import MutableMapping
 
 # Import dependencies from other axioms
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from axiom1 import primes_up_to
-from axiom2 import fib, PHI, GOLDEN_ANGLE
-from axiom3 import SpectralSignatureCache, accelerated_coherence
+from axiom2 import PHI, GOLDEN_ANGLE
+from axiom3 import SpectralSignatureCache, SegmentedLRU, accelerated_coherence
 
 
 class ObserverCache:
@@ -36,11 +36,16 @@ class ObserverCache:
         """
         self.cache_size = cache_size
         
-        # Core caches - using OrderedDict for LRU eviction
-        self.observation_cache = OrderedDict()  # (pos, scales_key) -> coherence
-        self.gradient_cache = OrderedDict()     # (n, pos, delta) -> gradient
+        # Core caches - plain dicts kept in LRU order (a hit re-inserts its
+        # key at the end); observations use a segmented LRU so positions
+        # revisited by collapse and navigation survive sweeps of one-off
+        # positions
+        protected_size = max(1, cache_size * 4 // 5)
+        self.observation_cache = SegmentedLRU(protected_size)  # (pos, scales_key) -> coherence
+        self.scales_keys: Dict[tuple, tuple] = {}  # canonical scales_key per scales
+        self.gradient_cache = {}                # (n, pos, delta) -> gradient
         self.state_cache = {}                   # (n, iteration) -> quantum_state
-        self.path_cache = OrderedDict()         # (n, start, end) -> path
+        self.path_cache = {}                    # (n, start, end) -> path tuple
         
         # Pre-computation flags
         self.precomputed_fibonacci = set()
@@ -56,6 +61,15 @@ class ObserverCache:
         self.path_hits = 0
         self.path_misses = 0
         
+        # Small divisors of each n, probed before every navigation (bounded
+        # by cache_size, oldest entry evicted first)
+        self.small_divisors: Dict[int, List[int]] = {}
+        
+        # Integer square roots and gradient step sizes per n, bounded by
+        # cache_size like the other caches (oldest entry evicted first)
+        self.roots: Dict[int, int] = {}
+        self.step_schedules: Dict[Tuple[int, int], Tuple[int, ...]] = {}
+        
         # Integration with Axiom 3
         self.spectral_cache = None
         
@@ -63,13 +77,16 @@ class ObserverCache:
         self.batch_mode = False
         
     def _make_scales_key(self, scales: Dict[str, int]) -> tuple:
-        """Convert scales dict to hashable key"""
-        return tuple(sorted(scales.items()))
+        """Convert scales dict to hashable key, shared by all equal scales"""
+        key = tuple(sorted(scales.items()))
+        return self.scales_keys.setdefault(key, key)
         
-    def _enforce_cache_limit(self, cache: OrderedDict):
+    def _enforce_cache_limit(self, cache: MutableMapping):
         """Enforce LRU eviction when cache exceeds limit"""
+        # Iteration starts at the least recently used entry, for plain
+        # dicts and SegmentedLRU alike
         while len(cache) > self.cache_size:
-            cache.popitem(last=False)  # Remove oldest
+            del cache[next(iter(cache))]  # Remove oldest
             
     def get_observation(self, observer: Any, position: int) -> float:
         """
@@ -86,17 +103,24 @@ class ObserverCache:
         scales_key = self._make_scales_key(observer.scales)
         key = (position, scales_key)
         
-        # Check cache
-        if key in self.observation_cache:
+        # Check cache (lookup also marks the entry as recently used)
+        value = self.observation_cache.lookup(key)
+        if value is not None:
             self.hits += 1
-            # Move to end (most recently used)
-            self.observation_cache.move_to_end(key)
-            return self.observation_cache[key]
+            return value
         
         # Cache miss - compute value
         self.misses += 1
+        value = self._observe(observer, position)
+        
+        # Cache the result
+        self.observation_cache[key] = value
+        self._enforce_cache_limit(self.observation_cache)
         
-        # Use accelerated coherence from Axiom 3 when computing
+        return value
+        
+    def _observe(self, observer: Any, position: int) -> float:
+        """Compute an uncached observation using Axiom 3's accelerated coherence"""
         # Store original coherence method and replace temporarily
         original_coherence = sys.modules.get('axiom3.coherence', None)
         if hasattr(original_coherence, 'coherence'):
@@ -104,22 +128,54 @@ class ObserverCache:
             original_coherence.coherence = accelerated_coherence
         
         try:
-            value = observer.observe(position)
+            return observer.observe(position)
         finally:
             # Restore original coherence
             if hasattr(original_coherence, 'coherence'):
                 original_coherence.coherence = original_func
         
-        # Cache the result
-        self.observation_cache[key] = value
-        self._enforce_cache_limit(self.observation_cache)
+    def get_observations_batch(self, observer: Any, positions: List[int]) -> List[float]:
+        """
+        Get observations for many positions of one observer
         
-        return value
+        Equivalent to calling get_observation per position (same values,
+        statistics and LRU order), but the scales key is built once for
+        the whole batch and cached positions cost a single lookup.
+        
+        Args:
+            observer: MultiScaleObserver instance
+            positions: Positions to observe
+            
+        Returns:
+            Observation coherence values in the order of positions
+        """
+        scales_key = self._make_scales_key(observer.scales)
+        observations = self.observation_cache
+        values = []
+        
+        for position in positions:
+            key = (position, scales_key)
+            
+            value = observations.lookup(key)
+            if value is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+                value = observations[key] = self._observe(observer, position)
+                self._enforce_cache_limit(observations)
+                
+            values.append(value)
+            
+        return values
         
     def get_gradient(self, n: int, position: int, observer: Any, delta: int = 1) -> float:
         """
         Get cached gradient or compute and cache
         
+        Gradients are central differences of cached observations, so
+        neighbouring positions (e.g. consecutive ascent steps) share their
+        endpoint observations.
+        
         Args:
             n: Number being factored
             position: Position to calculate gradient
@@ -132,30 +188,25 @@ class ObserverCache:
         key = (n, position, delta)
         
         # Check cache
-        if key in self.gradient_cache:
+        gradient = self.gradient_cache.get(key)
+        if gradient is not None:
             self.gradient_hits += 1
-            self.gradient_cache.move_to_end(key)
-            return self.gradient_cache[key]
+            del self.gradient_cache[key]
+            self.gradient_cache[key] = gradient
+            return gradient
         
         # Cache miss - compute gradient
         self.gradient_misses += 1
-        root = int(math.isqrt(n))
+        root = self.get_root(n)
         
         # Ensure position is in valid range
         if position < 2 or position > root:
             gradient = 0.0
         else:
-            # Forward difference
-            if position + delta <= root:
-                coh_plus = self.get_observation(observer, position + delta)
-            else:
-                coh_plus = self.get_observation(observer, position)
-            
-            # Backward difference
-            if position - delta >= 2:
-                coh_minus = self.get_observation(observer, position - delta)
-            else:
-                coh_minus = self.get_observation(observer, position)
+            # Forward and backward endpoints, clamped to the valid range
+            plus = position + delta if position + delta <= root else position
+            minus = position - delta if position - delta >= 2 else position
+            coh_plus, coh_minus = self.get_observations_batch(observer, [plus, minus])
             
             # Central difference gradient
             gradient = (coh_plus - coh_minus) / (2 * delta)
@@ -193,6 +244,68 @@ class ObserverCache:
         key = (n, iteration)
         return self.state_cache.get(key)
         
+    def get_small_divisors(self, n: int) -> List[int]:
+        """
+        Divisors d of n with 2 <= d <= min(sqrt(n), 99), computed once per n
+        
+        These are the endpoints under which navigation paths to small
+        factors are stored.
+        
+        Args:
+            n: Number being factored
+            
+        Returns:
+            Small divisors of n in increasing order
+        """
+        divisors = self.small_divisors.get(n)
+        if divisors is None:
+            root = self.get_root(n)
+            divisors = self.small_divisors[n] = [
+                d for d in range(2, min(root + 1, 100)) if n % d == 0
+            ]
+            self._enforce_cache_limit(self.small_divisors)
+        return divisors
+        
+    def get_root(self, n: int) -> int:
+        """
+        Integer square root of n, computed once per n
+        
+        Args:
+            n: Number being factored
+            
+        Returns:
+            isqrt(n)
+        """
+        root = self.roots.get(n)
+        if root is None:
+            root = self.roots[n] = math.isqrt(n)
+            self._enforce_cache_limit(self.roots)
+        return root
+        
+    def get_step_schedule(self, n: int, steps: int) -> Tuple[int, ...]:
+        """
+        Gradient step sizes max(1, int(sqrt(n) * 0.02 / (k + 1))) for k < steps
+        
+        Shared by collapse, navigation and gradient ascent, which shrink
+        their step by this schedule on every iteration.
+        
+        Args:
+            n: Number being factored
+            steps: Number of iterations
+            
+        Returns:
+            Step size for each iteration
+        """
+        key = (n, steps)
+        schedule = self.step_schedules.get(key)
+        if schedule is None:
+            root = self.get_root(n)
+            schedule = self.step_schedules[key] = tuple(
+                max(1, int(root * 0.02 / (k + 1))) for k in range(steps)
+            )
+            self._enforce_cache_limit(self.step_schedules)
+        return schedule
+        
     def store_navigation_path(self, n: int, start: int, end: int, path: List[int]):
         """
         Store successful navigation path
@@ -204,7 +317,8 @@ class ObserverCache:
             path: Path taken
         """
         key = (n, start, end)
-        self.path_cache[key] = path.copy()
+        # Stored as an immutable tuple: no later copy can alias it
+        self.path_cache[key] = tuple(path)
         self._enforce_cache_limit(self.path_cache)
         
     def get_navigation_path(self, n: int, start: int, end: int) -> Optional[List[int]]:
@@ -221,10 +335,12 @@ class ObserverCache:
         """
         key = (n, start, end)
         
-        if key in self.path_cache:
+        path = self.path_cache.get(key)
+        if path is not None:
             self.path_hits += 1
-            self.path_cache.move_to_end(key)
-            return self.path_cache[key].copy()
+            del self.path_cache[key]
+            self.path_cache[key] = path
+            return list(path)
         
         self.path_misses += 1
         return None
@@ -241,12 +357,10 @@ class ObserverCache:
             return
             
         root = int(math.isqrt(n))
-        k = 1
         
-        while True:
-            f = fib(k)
-            if f > root:
-                break
+        # Step F(k), F(k+1) forward rather than recomputing each F(k)
+        f, f_next = 1, 1
+        while f <= root:
             if f >= 2:
                 # Pre-compute observation
                 self.get_observation(observer, f)
@@ -260,7 +374,7 @@ class ObserverCache:
                 inv_golden = int(f / PHI)
                 if 2 <= inv_golden <= root:
                     self.get_observation(observer, inv_golden)
-            k += 1
+            f, f_next = f_next, f + f_next
             
         self.precomputed_fibonacci.add(n)
         
@@ -350,13 +464,12 @@ class ObserverCache:
             Dictionary mapping position to coherence
         """
         self.batch_mode = True
-        results = {}
         
         # Sort positions for better cache locality
         sorted_positions = sorted(positions)
         
-        for pos in sorted_positions:
-            results[pos] = self.get_observation(observer, pos)
+        results = dict(zip(sorted_positions,
+                           self.get_observations_batch(observer, sorted_positions)))
             
         self.batch_mode = False
         return results
@@ -388,14 +501,11 @@ class ObserverCache:
         critical_positions = []
         
         # Add Fibonacci positions
-        k = 1
-        while True:
-            f = fib(k)
-            if f > min(root, 100):
-                break
+        f, f_next = 1, 1
+        while f <= min(root, 100):
             if f >= 2:
                 critical_positions.append(f)
-            k += 1
+            f, f_next = f_next, f + f_next
             
         # Add small primes
         critical_positions.extend(primes_up_to(min(50, root)))
@@ -432,9 +542,13 @@ class ObserverCache:
     def clear(self):
         """Clear all caches"""
         self.observation_cache.clear()
+        self.scales_keys.clear()
         self.gradient_cache.clear()
         self.state_cache.clear()
         self.path_cache.clear()
+        self.small_divisors.clear()
+        self.roots.clear()
+        self.step_schedules.clear()
         self.precomputed_fibonacci.clear()
         self.precomputed_primes.clear()
         self.precomputed_sqrt.clear()
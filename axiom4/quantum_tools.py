@@ -11,7 +11,7 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from axiom1 import primes_up_to
-from axiom2 import fib, PHI
+from axiom2 import PHI
 
 class QuantumTunnel:
     """
@@ -45,15 +45,14 @@ class QuantumTunnel:
         target = min(self.root, blocked + width)
         candidates = []
         
-        # Find Fibonacci numbers beyond target
-        k = 1
-        while k < 30:
-            f = fib(k)
+        # Find Fibonacci numbers beyond target among F(1)..F(29)
+        f, f_next = 1, 1
+        for _ in range(29):
             if f > target and f <= self.root:
                 candidates.append(f)
-            k += 1
             if f > self.root:
                 break
+            f, f_next = f_next, f + f_next
         
         # Find primes beyond target
         primes = primes_up_to(min(target + 100, self.root))
@@ -220,14 +219,11 @@ class SpectralFolder:
                         folds.add(k)
         
         # Fibonacci folding points
-        k = 1
-        while True:
-            f = fib(k)
-            if f > self.root:
-                break
+        f, f_next = 1, 1
+        while f <= self.root:
             if f >= 2:
                 folds.add(f)
-            k += 1
+            f, f_next = f_next, f + f_next
         
         return sorted(list(folds))
     
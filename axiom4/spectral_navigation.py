@@ -70,6 +70,9 @@ def gradient_ascent(n: int, start: int, observer: MultiScaleObserver,
     path = [start]
     current = start
     
+    # Step sizes shrink as root * 0.02 / (step + 1); the scale is fixed
+    step_scale = root * 0.02
+    
     for step in range(max_steps):
         # Calculate gradient
         grad = coherence_gradient(n, current, observer)
@@ -79,7 +82,7 @@ def gradient_ascent(n: int, start: int, observer: MultiScaleObserver,
             break
         
         # Adaptive step size (decreases over time)
-        step_size = max(1, int(root * 0.02 / (step + 1)))
+        step_size = max(1, int(step_scale / (step + 1)))
         
         # Move in gradient direction
         if grad > 0:
@@ -202,21 +205,24 @@ def find_coherence_peaks(n: int, observer: MultiScaleObserver,
     step = max(1, root // resolution)
     
     peaks = []
+    observe = observer.observe
     prev_coh = 0.0
-    current_coh = observer.observe(2)
+    current_coh = observe(2)
     
     for x in range(3, root + 1, step):
-        next_coh = observer.observe(x)
+        next_coh = observe(x)
         
         # Check for local maximum
         if current_coh > prev_coh and current_coh > next_coh:
-            # Refine peak position
+            # Refine peak position, carrying the best coherence so far
             refined = x - step
+            refined_coh = observe(refined)
             for offset in range(-step, step + 1):
                 test_x = refined + offset
                 if 2 <= test_x <= root:
-                    if observer.observe(test_x) > observer.observe(refined):
-                        refined = test_x
+                    test_coh = observe(test_x)
+                    if test_coh > refined_coh:
+                        refined, refined_coh = test_x, test_coh
             peaks.append(refined)
         
         prev_coh = current_coh
@@ -246,7 +252,7 @@ def navigate_to_factor(n: int, start: int, observer: MultiScaleObserver,
     
     for iteration in range(max_iterations):
         # Check if current is a factor
-        if n % current == 0 and current > 1:
+        if current > 1 and n % current == 0:
             return current
         
         # Mark as visited
@@ -259,7 +265,7 @@ def navigate_to_factor(n: int, start: int, observer: MultiScaleObserver,
             new_pos = path[-1]
             
             # Check if we found a factor
-            if n % new_pos == 0 and new_pos > 1:
+            if new_pos > 1 and n % new_pos == 0:
                 return new_pos
             
             # Check if we're stuck
@@ -297,14 +303,12 @@ def coherence_flow_lines(n: int, observer: MultiScaleObserver,
     # Generate starting points using golden angle
     from axiom2 import GOLDEN_ANGLE
     angle = 0
+    center = root // 2
     
     for i in range(num_lines):
-        # Starting point on a spiral
+        # Starting point on a spiral, mapped to 1D by its x coordinate
         radius = root * (i + 1) / (num_lines + 1)
-        x = int(root // 2 + radius * math.cos(angle))
-        y = int(root // 2 + radius * math.sin(angle))
-        
-        # Map to 1D position
+        x = int(center + radius * math.cos(angle))
         start = max(2, min(root, x))
         
         # Follow gradient from this point
@@ -88,6 +88,18 @@ def test_accelerated_collapse():
     # Cache should have quantum states
     assert len(cache.state_cache) > 0
     
+    # Explored states hold each position once
+    for iteration in range(2):
+        positions = [x for x, _ in cache.get_quantum_state(n, iteration)]
+        assert len(positions) == len(set(positions))
+    
+    # A dividing candidate ends the collapse after a single observation
+    early_cache = ObserverCache()
+    early = accelerated_collapse(n, candidates, observer, cache=early_cache,
+                                 stop_on_factor=True)
+    assert early == [(13, early_cache.get_observation(observer, 13))]
+    assert early_cache.misses == 1
+    
     print("✓ Accelerated collapse")
 
 def test_quantum_state_resumption():
@@ -216,6 +228,19 @@ def test_accelerated_multi_path():
     for i in range(len(endpoints) - 1):
         assert endpoints[i][1] >= endpoints[i+1][1]
     
+    # Converging paths report each endpoint once
+    endpoints = accelerated_multi_path(n, starts * 2, observer, cache=cache)
+    positions = [pos for pos, _ in endpoints]
+    assert len(positions) == len(set(positions))
+    assert sorted(endpoints, key=lambda t: -t[1]) == endpoints
+    
+    # Repeated starts are ascended once
+    single, double = ObserverCache(), ObserverCache()
+    once = accelerated_multi_path(n, starts, observer, cache=single)
+    twice = accelerated_multi_path(n, starts * 2, observer, cache=double)
+    assert once == twice
+    assert double.gradient_hits + double.gradient_misses == single.gradient_hits + single.gradient_misses
+    
     print("✓ Accelerated multi-path")
 
 def test_create_accelerated_observer():
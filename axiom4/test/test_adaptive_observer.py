@@ -33,6 +33,11 @@ def test_multi_scale_observer_init():
     for scale in observer.scales.values():
         assert scale > 0
     
+    # Inverse-log weights are computed once, in scale order
+    assert observer.scale_weights == [
+        (scale, 1 / (1 + math.log(max(1, scale)))) for scale in observer.scales.values()
+    ]
+    
     print("✓ MultiScaleObserver initialization")
 
 def test_coherence_at_scale():
@@ -70,6 +75,15 @@ def test_multi_scale_observe():
     assert observer.observe(1) == 0  # Too small
     assert observer.observe(100) == 0  # Too large
     
+    # Shared samples give the same total as independent scale windows
+    big = MultiScaleObserver(10403)  # 101 × 103
+    for x in [2, 50, 101]:
+        expected = 0.0
+        for scale in big.scales.values():
+            weight = 1 / (1 + math.log(max(1, scale)))
+            expected += weight * big.coherence_at_scale(x, scale)
+        assert big.observe(x) == expected
+    
     print("✓ Multi-scale observation")
 
 def test_coherence_field():
@@ -88,6 +102,12 @@ def test_coherence_field():
         assert pos in positions
         assert 0 <= coh <= 1
     
+    # Sharing samples across the field leaves each observation unchanged
+    observer = MultiScaleObserver(10403)
+    positions = list(range(1, 110, 3))
+    field = observer.coherence_field(positions)
+    assert field == {pos: observer.observe(pos) for pos in positions}
+    
     print("✓ Coherence field generation")
 
 def test_generate_superposition():
@@ -109,6 +129,15 @@ def test_generate_superposition():
     assert 2 in superposition or 3 in superposition
     assert 5 in superposition or 8 in superposition
     
+    # Every Fibonacci number up to sqrt(n) and the sqrt neighbourhood below
+    # sqrt(n) are included
+    n = 10403  # 101 × 103, sqrt range 10
+    superposition = generate_superposition(n)
+    assert {2, 3, 5, 8, 13, 21, 34, 55, 89} <= set(superposition)
+    assert set(range(91, 102)) <= set(superposition)
+    assert superposition == sorted(set(superposition))
+    assert max(superposition) == 101
+    
     print("✓ Quantum superposition generation")
 
 def test_collapse_wavefunction():
@@ -130,6 +159,15 @@ def test_collapse_wavefunction():
     weights = [w for _, w in collapsed]
     assert weights == sorted(weights, reverse=True)
     
+    # A dividing candidate ends the collapse before any refinement
+    early = collapse_wavefunction(n, candidates, observer, stop_on_factor=True)
+    assert early == [(11, observer.observe(11))]
+    
+    # Otherwise it ends at the first refined position that divides n
+    early = collapse_wavefunction(n, [5, 7, 9], observer, iterations=3,
+                                  stop_on_factor=True)
+    assert len(early) == 1 and n % early[0][0] == 0
+    
     print("✓ Wavefunction collapse")
 
 def test_gradient_field():
@@ -146,6 +184,24 @@ def test_gradient_field():
     for pos in field.keys():
         assert 4 <= pos <= 10  # center ± radius
     
+    # Each position is observed once, however many gradients share it
+    observed = []
+    
+    class CountingObserver(MultiScaleObserver):
+        def observe(self, x, samples=None):
+            observed.append(x)
+            return super().observe(x, samples)
+    
+    counting = CountingObserver(10403)
+    field = create_coherence_gradient_field(10403, counting, center=50, radius=10)
+    assert len(observed) == len(set(observed)) == 23
+    plain = MultiScaleObserver(10403)
+    assert field[50] == (plain.observe(51) - plain.observe(49)) / 2
+    
+    observed.clear()
+    collapse_wavefunction(10403, [20, 40, 60, 80], counting, iterations=3)
+    assert len(observed) == len(set(observed))
+    
     print("✓ Coherence gradient field")
 
 def test_observer_determinism():
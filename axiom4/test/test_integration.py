@@ -24,6 +24,7 @@ def test_integrated_observer():
     
     # Create integrated observer
     observer = IntegratedObserver(n)
+    assert observer.root == 11  # isqrt(143), computed once
     
     # Test observation
     obs1 = observer.observe(11)
@@ -78,6 +79,16 @@ def test_integrated_search():
     factor = integrated_observer_search(n, memory=memory, max_iterations=50)
     assert factor in [13, 17] or factor is None
     
+    # Collapse stops at the first dividing candidate: for n = 143 the
+    # superposition already holds 11 and 13
+    observer = IntegratedObserver(143)
+    misses = observer.cache.misses
+    collapsed = observer.collapse_wavefunction(generate_superposition(143),
+                                               stop_on_factor=True)
+    assert collapsed == [(11, observer.observe(11))]
+    assert observer.cache.misses <= misses + 1
+    assert integrated_observer_search(143) == 11
+    
     print("✓ Integrated observer search")
 
 def test_integrated_axiom4_factor():
@@ -94,6 +105,17 @@ def test_integrated_axiom4_factor():
     
     print("✓ Integrated Axiom 4 factorization")
 
+def test_stratified_positions():
+    """Test stratified start positions are distinct and in range"""
+    from axiom4.integrated_tools import _stratified_positions
+    
+    # Small roots repeat grid points; each is kept once, in order
+    assert _stratified_positions(10, 21) == [2, 3, 4, 5, 6, 7, 8, 9]
+    assert _stratified_positions(100, 11) == [int(100 * i / 11) for i in range(1, 11)]
+    assert _stratified_positions(3, 11) == [2]
+    
+    print("✓ Stratified positions")
+
 def test_acceleration_integration():
     """Test that acceleration is properly integrated"""
     n = 323  # 17 × 19
@@ -206,6 +228,7 @@ def run_all_tests():
     test_integrated_observer()
     test_integrated_search()
     test_integrated_axiom4_factor()
+    test_stratified_positions()
     test_acceleration_integration()
     test_cache_effectiveness()
     test_memory_integration()
@@ -51,6 +51,31 @@ def test_observation_caching():
     
     print("✓ Observation caching")
 
+def test_observations_batch():
+    """Test batched observations match per-position lookups"""
+    n = 143  # 11 × 13
+    observer = MultiScaleObserver(n)
+    positions = [7, 3, 9, 3, 11]
+    
+    single = ObserverCache()
+    expected = [single.get_observation(observer, x) for x in positions]
+    
+    batched = ObserverCache()
+    values = batched.get_observations_batch(observer, positions)
+    
+    assert values == expected
+    assert (batched.hits, batched.misses) == (single.hits, single.misses) == (1, 4)
+    assert list(batched.observation_cache) == list(single.observation_cache)
+    
+    # Empty batch
+    assert batched.get_observations_batch(observer, []) == []
+    
+    # Stored keys share a single scales tuple per cache
+    for cache in (single, batched):
+        assert len({id(scales_key) for _, scales_key in cache.observation_cache}) == 1
+    
+    print("✓ Batched observations")
+
 def test_gradient_caching():
     """Test gradient caching behavior"""
     n = 77  # 7 × 11
@@ -74,6 +99,34 @@ def test_gradient_caching():
     grad3 = cache.get_gradient(n, 5, observer, delta=2)
     assert cache.gradient_misses == 2
     
+    # Gradients are central differences of the shared observations
+    hits = cache.hits
+    assert grad1 == (cache.get_observation(observer, 6) - cache.get_observation(observer, 4)) / 2
+    assert grad3 == (cache.get_observation(observer, 7) - cache.get_observation(observer, 3)) / 4
+    assert cache.hits == hits + 4
+    
+    # A neighbouring position reuses an endpoint already observed
+    misses = cache.misses
+    cache.get_gradient(n, 6, observer)
+    assert cache.misses == misses + 1
+    
+    # Roots and step schedules are computed once per n
+    big = 10**20 + 39
+    assert cache.get_root(big) == math.isqrt(big)
+    schedule = cache.get_step_schedule(big, 5)
+    assert schedule == tuple(max(1, int(math.isqrt(big) * 0.02 / (k + 1))) for k in range(5))
+    assert cache.get_step_schedule(big, 5) is schedule
+    assert cache.get_step_schedule(n, 3) == (1, 1, 1)
+    cache.clear()
+    assert not cache.roots and not cache.step_schedules
+    
+    # Both tables stay within cache_size across many distinct n
+    bounded = ObserverCache(cache_size=3)
+    for m in range(100, 110):
+        bounded.get_step_schedule(m, 5)
+    assert list(bounded.roots) == [107, 108, 109]
+    assert list(bounded.step_schedules) == [(107, 5), (108, 5), (109, 5)]
+    
     print("✓ Gradient caching")
 
 def test_quantum_state_caching():
@@ -111,10 +164,29 @@ def test_navigation_path_caching():
     assert retrieved == path
     assert cache.path_hits == 1
     
+    # Neither the stored nor the returned list aliases the cached path
+    path.append(11)
+    retrieved.append(13)
+    assert cache.get_navigation_path(n, start=2, end=7) == [2, 3, 5, 7]
+    assert cache.path_hits == 2
+    
     # Non-existent path should return None
     assert cache.get_navigation_path(n, start=3, end=7) is None
     assert cache.path_misses == 1
     
+    # Small divisors are bounded by sqrt(n) and by 99
+    assert cache.get_small_divisors(n) == [7]
+    assert cache.get_small_divisors(2 * 3 * 101 * 103) == [2, 3, 6]
+    assert cache.get_small_divisors(97) == []
+    assert 91 in cache.small_divisors
+    
+    # The table stays within cache_size across many distinct n
+    bounded = ObserverCache(cache_size=2)
+    for m in [91, 97, 143, 221]:
+        bounded.get_small_divisors(m)
+    assert list(bounded.small_divisors) == [143, 221]
+    assert bounded.get_small_divisors(91) == [7]
+    
     print("✓ Navigation path caching")
 
 def test_lru_eviction():
@@ -145,6 +217,27 @@ def test_lru_eviction():
     cache.get_observation(observer, 3)
     assert cache.hits == initial_hits + 1
     
+    # A re-used position survives a sweep of one-off positions larger
+    # than the cache
+    scan = ObserverCache(cache_size=5)
+    scan.get_observation(observer, 2)
+    scan.get_observation(observer, 2)
+    big = MultiScaleObserver(10403)
+    for x in range(2, 40):
+        scan.get_observation(big, x)
+    hits = scan.hits
+    scan.get_observation(observer, 2)
+    assert scan.hits == hits + 1
+    assert len(scan.observation_cache) == 5
+    
+    # Gradients are a plain-dict LRU: a hit moves the entry to the back
+    grads = ObserverCache(cache_size=2)
+    grads.get_gradient(n, 2, observer)
+    grads.get_gradient(n, 3, observer)
+    grads.get_gradient(n, 2, observer)
+    grads.get_gradient(n, 4, observer)
+    assert list(grads.gradient_cache) == [(n, 2, 1), (n, 4, 1)]
+    
     print("✓ LRU eviction")
 
 def test_precompute_fibonacci():
@@ -375,6 +468,7 @@ def run_all_tests():
     
     test_observer_cache_init()
     test_observation_caching()
+    test_observations_batch()
     test_gradient_caching()
     test_quantum_state_caching()
     test_navigation_path_caching()
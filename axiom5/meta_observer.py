@@ -358,7 +358,8 @@ def analyze_axiom_interference(observers: List[MetaObserver]) -> Dict[Tuple[str,
                 coh_change = abs(curr['coherence'] - prev['coherence'])
                 
                 # High change = high interference
-                pair = tuple(sorted([prev['axiom'], curr['axiom']]))
+                a, b = prev['axiom'], curr['axiom']
+                pair = (a, b) if a <= b else (b, a)
                 interference[pair] += coh_change
     
     # Normalize by count
@@ -368,7 +369,8 @@ def analyze_axiom_interference(observers: List[MetaObserver]) -> Dict[Tuple[str,
             prev = observer.observation_history[i-1]
             curr = observer.observation_history[i]
             if prev['axiom'] != curr['axiom']:
-                pair = tuple(sorted([prev['axiom'], curr['axiom']]))
+                a, b = prev['axiom'], curr['axiom']
+                pair = (a, b) if a <= b else (b, a)
                 counts[pair] += 1
     
     for pair in interference:
@@ -50,6 +50,7 @@ setup(
         "dev": [
             "pytest>=6.0",
             "pytest-cov>=2.0",
+            "pytest-xdist>=2.0",
             "black>=22.0",
             "flake8>=4.0",
             "mypy>=0.900",